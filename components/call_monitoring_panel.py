@@ -5,16 +5,110 @@ Real-time monitoring dashboard for active calls, DLQ status, and reconciliation.
 """
 
 import streamlit as st
+import numpy as np
+import pandas as pd
 import asyncio
-from datetime import datetime
-from typing import Dict, Any
-
-from database.connection import get_session
-from services.call_monitoring_service import get_call_monitoring_service
-from services.dlq_monitoring_service import get_dlq_monitoring_service
-from services.reconciliation_service import get_reconciliation_service
+import html
+import logging
+import threading
+import time
+from typing import Dict, Any, Awaitable, TypeVar
+
+# Service imports (Redis, SQLAlchemy, httpx clients) are deferred to the
+# functions that use them so importing this module stays cheap.
 from utils.formatters import format_phone, format_duration
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Health status -> indicator icon
+_HEALTH_ICON = {
+    "healthy": "🟢",
+    "warning": "🟡",
+    "stale": "🔴",
+}
+
+
+@st.cache_resource
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop used by the monitoring panel.
+
+    The loop runs forever on a daemon thread so the async Redis pool and HTTP
+    clients stay bound to a live loop across reruns, instead of being rebuilt
+    by a fresh asyncio.run() on every refresh.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running event loop
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="monitoring-loop", daemon=True).start()
+    return loop
+
+
+def _run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared monitoring loop and wait for its result.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        Result of the coroutine
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+@st.cache_resource
+def _call_service():
+    """Get the call monitoring service shared across reruns.
+
+    Returns:
+        CallMonitoringService: Service instance
+    """
+    from services.call_monitoring_service import get_call_monitoring_service
+
+    return get_call_monitoring_service()
+
+
+@st.cache_resource
+def _dlq_service():
+    """Get the DLQ monitoring service shared across reruns.
+
+    Returns:
+        DLQMonitoringService: Service instance
+    """
+    from services.dlq_monitoring_service import get_dlq_monitoring_service
+
+    return get_dlq_monitoring_service()
+
+
+@st.cache_resource
+def _recon_service():
+    """Get the reconciliation service shared across reruns.
+
+    Its HTTP client lives on the shared monitoring loop and is kept open so
+    refreshes reuse pooled connections.
+
+    Returns:
+        ReconciliationService: Service instance
+    """
+    from services.reconciliation_service import get_reconciliation_service
+
+    return get_reconciliation_service()
+
+
+@st.cache_resource
+def _connect_redis() -> bool:
+    """Connect the shared Redis service once per process.
+
+    Later calls reuse the pooled connection; the Redis service reconnects on
+    its own if the connection drops.
+
+    Returns:
+        bool: True if the initial connection succeeded
+    """
+    return _run_async(_call_service().redis_service.connect())
+
 
 def render_monitoring_panel(auto_refresh: bool = True, refresh_interval: int = 5):
     """Render the complete call monitoring panel.
@@ -25,10 +119,24 @@ def render_monitoring_panel(auto_refresh: bool = True, refresh_interval: int = 5
     - DLQ status (expandable)
     - Reconciliation status (expandable)
 
+    The panel runs as an ``st.fragment`` so auto-refresh and widget interactions
+    inside it only re-execute the panel, not the whole page.
+
     Args:
         auto_refresh: Enable auto-refresh
         refresh_interval: Refresh interval in seconds (default: 5)
     """
+    run_every = refresh_interval if auto_refresh else None
+    st.fragment(_render_panel, run_every=run_every)(auto_refresh, refresh_interval)
+
+
+def _render_panel(auto_refresh: bool, refresh_interval: int):
+    """Render the panel body (executed as a fragment).
+
+    Args:
+        auto_refresh: Enable auto-refresh
+        refresh_interval: Refresh interval in seconds
+    """
     # Create container for monitoring panel
     with st.container():
         # Header with refresh controls
@@ -38,38 +146,27 @@ def render_monitoring_panel(auto_refresh: bool = True, refresh_interval: int = 5
             st.markdown("### 📊 Real-Time Call Monitoring")
 
         with header_col2:
-            # Manual refresh button
+            # Manual refresh button (the click already reruns the fragment,
+            # so dropping the memoized data is enough to force a fresh fetch)
             if st.button("🔄 Refresh Now", use_container_width=True):
-                st.cache_data.clear()
-                st.rerun()
+                _fetch_monitoring_data_cached.clear()
 
-        # Auto-refresh toggle and status
-        if auto_refresh:
-            # Show last updated time
-            if "monitoring_last_update" not in st.session_state:
-                st.session_state.monitoring_last_update = datetime.utcnow()
-
-            last_update = st.session_state.monitoring_last_update
-            time_since_update = (datetime.utcnow() - last_update).seconds
+        # Fetch data from services (memoized per refresh interval)
+        ttl_bucket = int(time.time() // refresh_interval)
+        monitoring_data = _fetch_monitoring_data_cached(refresh_interval, ttl_bucket)
 
+        # Auto-refresh status
+        if auto_refresh:
+            time_since_update = int(time.monotonic() - monitoring_data["fetched_at_mono"])
             st.caption(
                 f"🔄 Auto-refresh enabled (every {refresh_interval}s) • "
                 f"Last updated: {time_since_update}s ago"
             )
-
-            # Trigger rerun after interval
-            if time_since_update >= refresh_interval:
-                st.session_state.monitoring_last_update = datetime.utcnow()
-                st.cache_data.clear()
-                st.rerun()
         else:
             st.caption("ℹ️ Auto-refresh disabled")
 
-        # Fetch data from services
-        monitoring_data = asyncio.run(_fetch_monitoring_data())
-
-        # Update last update time
-        st.session_state.monitoring_last_update = datetime.utcnow()
+        if monitoring_data.get("error"):
+            st.error(f"Error fetching monitoring data: {monitoring_data['error']}")
 
         # Render metrics row
         _render_metrics_row(monitoring_data)
@@ -82,27 +179,49 @@ def render_monitoring_panel(auto_refresh: bool = True, refresh_interval: int = 5
         _render_reconciliation_section(monitoring_data["reconciliation"])
 
 
-async def _fetch_monitoring_data() -> Dict[str, Any]:
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_monitoring_data_cached(refresh_interval: int, ttl_bucket: int) -> Dict[str, Any]:
+    """Fetch monitoring data at most once per refresh interval.
+
+    Reruns triggered by widgets inside the panel (expanders, buttons) reuse the
+    memoized result until ``ttl_bucket`` ticks over to the next interval.
+
+    Args:
+        refresh_interval: Refresh interval in seconds (part of the cache key)
+        ttl_bucket: ``time.time() // refresh_interval`` for the current interval
+
+    Returns:
+        Dict with active_calls, dlq, reconciliation data and fetched_at_mono
+    """
+    _connect_redis()
+    data = _run_async(_fetch_monitoring_data(_call_service(), _dlq_service(), _recon_service()))
+    # Monotonic clock: cheap and immune to wall-clock jumps (cache is per process)
+    data["fetched_at_mono"] = time.monotonic()
+    return data
+
+
+async def _fetch_monitoring_data(call_service, dlq_service, recon_service) -> Dict[str, Any]:
     """Fetch all monitoring data from services.
 
+    Args:
+        call_service: Call monitoring service
+        dlq_service: DLQ monitoring service
+        recon_service: Reconciliation service
+
     Returns:
         Dict with active_calls, dlq, and reconciliation data
     """
-    call_service = get_call_monitoring_service()
-    dlq_service = get_dlq_monitoring_service()
-    recon_service = get_reconciliation_service()
+    from database.connection import get_session
 
     try:
-        # Connect to Redis
-        await call_service.redis_service.connect()
-
-        # Fetch data from all services
+        # Fetch data from all services concurrently
         with get_session() as db_session:
-            active_calls = await call_service.get_active_calls_with_business(db_session)
-            health_summary = await call_service.get_health_summary()
-
-        dlq_summary = await dlq_service.get_dlq_summary()
-        recon_status = await recon_service.get_reconciliation_status()
+            active_calls, health_summary, dlq_summary, recon_status = await asyncio.gather(
+                call_service.get_active_calls_with_business(db_session),
+                call_service.get_health_summary(),
+                dlq_service.get_dlq_summary(),
+                recon_service.get_reconciliation_status(),
+            )
 
         return {
             "active_calls": {
@@ -115,15 +234,14 @@ async def _fetch_monitoring_data() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        st.error(f"Error fetching monitoring data: {str(e)}")
+        # Runs off the script thread, so surface the error to the caller
+        logger.error(f"Error fetching monitoring data: {str(e)}", exc_info=True)
         return {
             "active_calls": {"calls": [], "count": 0, "health_summary": {}},
             "dlq": {"depth": 0, "has_failures": False, "recent_messages": []},
             "reconciliation": {"last_run_at": None, "status": "error"},
+            "error": str(e),
         }
-    finally:
-        # Clean up
-        await recon_service.close()
 
 
 def _render_metrics_row(data: Dict[str, Any]):
@@ -164,8 +282,7 @@ def _render_metrics_row(data: Dict[str, Any]):
     # Last reconciliation
     with col3:
         recon = data["reconciliation"]
-        recon_service = get_reconciliation_service()
-        last_run_text = recon_service.format_last_run_time(recon.get("last_run_at"))
+        last_run_text = _recon_service().format_last_run_time(recon.get("last_run_at"))
 
         st.metric(
             "Last Reconciliation",
@@ -180,13 +297,13 @@ def _render_metrics_row(data: Dict[str, Any]):
         warning_count = health.get("warning", 0)
 
         if stale_count > 0:
-            health_status = "🔴 Issues"
+            health_status = f"{_HEALTH_ICON['stale']} Issues"
             health_delta = f"{stale_count} stale"
         elif warning_count > 0:
-            health_status = "🟡 Warning"
+            health_status = f"{_HEALTH_ICON['warning']} Warning"
             health_delta = f"{warning_count} slow"
         else:
-            health_status = "🟢 Healthy"
+            health_status = f"{_HEALTH_ICON['healthy']} Healthy"
             health_delta = None
 
         st.metric(
@@ -218,54 +335,44 @@ def _render_active_calls_section(data: Dict[str, Any]):
         # Render calls table
         st.markdown("**Current Active Calls**")
 
-        for call in calls:
-            # Health indicator
-            health_icon = {
-                "healthy": "🟢",
-                "warning": "🟡",
-                "stale": "🔴",
-            }.get(call["health_status"], "⚪")
-
-            # Format heartbeat age
-            heartbeat_text = "No heartbeat"
-            if call["heartbeat_age_seconds"] is not None:
-                age = call["heartbeat_age_seconds"]
-                if age < 60:
-                    heartbeat_text = f"{age}s ago"
-                elif age < 3600:
-                    heartbeat_text = f"{age // 60}m {age % 60}s ago"
-                else:
-                    heartbeat_text = f"{age // 3600}h {(age % 3600) // 60}m ago"
-
-            # Call row
-            col1, col2, col3, col4, col5 = st.columns([1, 3, 3, 2, 2])
-
-            with col1:
-                st.markdown(f"### {health_icon}")
-
-            with col2:
-                st.markdown(f"**{format_phone(call['from_phone'])}**")
-                st.caption(call["business_name"])
-
-            with col3:
-                st.markdown(f"Duration: **{format_duration(call['duration_seconds'])}**")
-                st.caption(f"Started: {call['start_time'].strftime('%H:%M:%S')}")
-
-            with col4:
-                st.markdown(f"Heartbeat:")
-                st.caption(heartbeat_text)
-
-            with col5:
-                st.caption(f"SID: {call['call_sid'][:10]}...")
-
-            # Warning for stale calls
-            if call["health_status"] == "stale":
-                st.warning(
-                    f"⚠️ **Stale call detected!** No heartbeat for {heartbeat_text}. Call may have crashed.",
-                    icon="⚠️"
-                )
+        # Build columns in one pass; heartbeat text is bucketized vectorially
+        raw_ages = [c["heartbeat_age_seconds"] for c in calls]
+        has_heartbeat = np.array([age is not None for age in raw_ages], dtype=bool)
+        ages = np.array([age if age is not None else 0 for age in raw_ages], dtype=np.int64)
+        df = pd.DataFrame({
+            "health": [_HEALTH_ICON.get(c["health_status"], "⚪") for c in calls],
+            "from_phone": [format_phone(c["from_phone"]) for c in calls],
+            "business_name": [c["business_name"] for c in calls],
+            "duration": [format_duration(c["duration_seconds"]) for c in calls],
+            "started": [c["start_time"].strftime("%H:%M:%S") for c in calls],
+            "heartbeat": _format_heartbeat_ages(ages, has_heartbeat),
+            "call_sid": [c["call_sid"][:10] + "..." for c in calls],
+        })
+        stale = df[[c["health_status"] == "stale" for c in calls]]
+        stale_calls = [f"{sid} ({hb})" for sid, hb in zip(stale["call_sid"], stale["heartbeat"])]
+
+        st.dataframe(
+            df,
+            column_config={
+                "health": st.column_config.TextColumn("", width="small"),
+                "from_phone": st.column_config.TextColumn("From", width="medium"),
+                "business_name": st.column_config.TextColumn("Business", width="medium"),
+                "duration": st.column_config.TextColumn("Duration", width="small"),
+                "started": st.column_config.TextColumn("Started", width="small"),
+                "heartbeat": st.column_config.TextColumn("Heartbeat", width="small"),
+                "call_sid": st.column_config.TextColumn("SID", width="small"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
 
-            st.divider()
+        # Single aggregated warning for stale calls
+        if stale_calls:
+            st.warning(
+                f"⚠️ **{len(stale_calls)} stale call(s) detected!** No recent heartbeat for: "
+                f"{', '.join(stale_calls)}. Calls may have crashed.",
+                icon="⚠️"
+            )
 
         # Show health summary
         st.caption(
@@ -275,6 +382,32 @@ def _render_active_calls_section(data: Dict[str, Any]):
         )
 
 
+def _format_heartbeat_ages(ages: np.ndarray, has_heartbeat: np.ndarray) -> np.ndarray:
+    """Format heartbeat ages for display in a single vectorized pass.
+
+    Args:
+        ages: Heartbeat ages in seconds (may be negative under clock skew)
+        has_heartbeat: False where no heartbeat was seen (age is ignored)
+
+    Returns:
+        np.ndarray: Strings like "45s ago", "2m 5s ago", "1h 3m ago" or "No heartbeat"
+    """
+    hours = (ages // 3600).astype(str)
+    minutes = (ages // 60).astype(str)
+    minutes_of_hour = ((ages % 3600) // 60).astype(str)
+    seconds = (ages % 60).astype(str)
+
+    return np.select(
+        [~has_heartbeat, ages < 60, ages < 3600],
+        [
+            "No heartbeat",
+            np.char.add(ages.astype(str), "s ago"),
+            np.char.add(np.char.add(np.char.add(minutes, "m "), seconds), "s ago"),
+        ],
+        default=np.char.add(np.char.add(np.char.add(hours, "h "), minutes_of_hour), "m ago"),
+    )
+
+
 def _render_dlq_section(data: Dict[str, Any]):
     """Render DLQ status section.
 
@@ -297,32 +430,27 @@ def _render_dlq_section(data: Dict[str, Any]):
         if messages:
             st.markdown("**Recent Failed Operations:**")
 
+            # One HTML block for all entries instead of columns + divider per row
+            entries = []
             for msg in messages[:10]:  # Show up to 10
-                col1, col2, col3 = st.columns([2, 3, 2])
-
-                with col1:
-                    st.markdown(f"**Call SID:**")
-                    st.caption(msg["call_sid"][:15] + "...")
-
-                with col2:
-                    st.markdown(f"**Error:**")
-                    st.caption(msg["error_message"])
-
-                with col3:
-                    st.markdown(f"**Retry:**")
-                    retry_status = msg["retry_status"]
-                    retry_in = msg.get("retry_in", "Unknown")
+                retry_status = html.escape(msg["retry_status"])
+                if msg["is_final_failure"]:
+                    retry_html = f'<span style="color: #b91c1c;">{retry_status} - FAILED</span>'
+                else:
+                    retry_in = html.escape(str(msg.get("retry_in") or "Unknown"))
+                    retry_html = f"{retry_status} - in {retry_in}"
 
-                    if msg["is_final_failure"]:
-                        st.error(f"{retry_status} - FAILED")
-                    else:
-                        st.info(f"{retry_status} - in {retry_in}")
+                # Encode newlines so blank lines can't end the HTML block early
+                full_error = html.escape(msg["full_error"] or "").replace("\n", "&#10;")
 
-                # Show full error in expander
-                with st.expander(f"View full error for {msg['call_sid'][:10]}"):
-                    st.code(msg["full_error"], language="text")
+                entries.append(
+                    f"<div><b>Call SID:</b> {html.escape(msg['call_sid'][:15])}... &nbsp;•&nbsp; "
+                    f"<b>Retry:</b> {retry_html}<br>"
+                    f"<b>Error:</b> {html.escape(msg['error_message'])}"
+                    f"<details><summary>View full error</summary><pre>{full_error}</pre></details></div>"
+                )
 
-                st.divider()
+            st.markdown("<hr>".join(entries), unsafe_allow_html=True)
 
 
 def _render_reconciliation_section(data: Dict[str, Any]):
@@ -342,8 +470,7 @@ def _render_reconciliation_section(data: Dict[str, Any]):
 
     with st.expander("🔄 Reconciliation Status", expanded=expanded):
         # Last run info
-        recon_service = get_reconciliation_service()
-        last_run_text = recon_service.format_last_run_time(last_run_at)
+        last_run_text = _recon_service().format_last_run_time(last_run_at)
 
         col1, col2, col3 = st.columns(3)
 
@@ -374,29 +501,14 @@ def _render_reconciliation_section(data: Dict[str, Any]):
 
         if st.button("🔄 Trigger Reconciliation Now", type="primary", use_container_width=True):
             with st.spinner("Triggering reconciliation job..."):
-                result = asyncio.run(_trigger_reconciliation())
+                result = _run_async(_recon_service().trigger_reconciliation())
 
                 if result["success"]:
                     st.success(f"✅ {result['message']}")
                     st.caption(f"Task ID: {result.get('task_id')}")
-                    # Wait a moment then rerun to show updated status
-                    asyncio.run(asyncio.sleep(2))
-                    st.rerun()
+                    # Next auto-refresh tick picks up the updated status
+                    _fetch_monitoring_data_cached.clear()
                 else:
                     st.error(f"❌ {result['message']}")
                     if result.get("error"):
                         st.caption(f"Error: {result['error']}")
-
-
-async def _trigger_reconciliation() -> Dict[str, Any]:
-    """Trigger reconciliation job.
-
-    Returns:
-        Dict with success status and message
-    """
-    recon_service = get_reconciliation_service()
-    try:
-        result = await recon_service.trigger_reconciliation()
-        return result
-    finally:
-        await recon_service.close()
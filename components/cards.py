@@ -2,9 +2,62 @@
 Card components for metrics and information display.
 """
 import streamlit as st
+from functools import lru_cache
 from typing import Optional
 
 
+# HTML format strings built once at import; cards only fill in values per call.
+# The cards rely on styling (shadow, colored left border) that native
+# containers can't reproduce, so they stay as HTML.
+_STAT_CARD_TEMPLATE = (
+    """
+        <div style="padding: 1.5rem; background: white; border-radius: 0.5rem;
+                    border: 1px solid #e5e7eb; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+            <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+                <span style="font-size: 1.5rem;">{icon}</span>
+                <h3 style="margin: 0; color: #1f2937; font-size: 0.875rem; font-weight: 600;">
+                    {title}
+                </h3>
+            </div>
+            <div style="font-size: 2rem; font-weight: 700; color: #111827; margin-bottom: 0.25rem;">
+                {value}
+            </div>
+            {description_html}
+        </div>
+        """
+)
+
+_STAT_CARD_DESCRIPTION_TEMPLATE = (
+    '<div style="color: #6b7280; font-size: 0.875rem;">{description}</div>'
+)
+
+_INFO_CARD_TEMPLATE = (
+    """
+        <div style="padding: 1rem; background: {bg}; border-radius: 0.5rem;
+                    border-left: 4px solid {border}; margin: 1rem 0;">
+            <div style="display: flex; align-items: flex-start; gap: 0.75rem;">
+                <span style="font-size: 1.25rem;">{icon}</span>
+                <div>
+                    <div style="font-weight: 600; color: {text}; margin-bottom: 0.25rem;">
+                        {title}
+                    </div>
+                    <div style="color: {text}; font-size: 0.875rem;">
+                        {content}
+                    </div>
+                </div>
+            </div>
+        </div>
+        """
+)
+
+_INFO_CARD_COLORS = {
+    "blue": {"bg": "#eff6ff", "border": "#3b82f6", "text": "#1e40af"},
+    "green": {"bg": "#f0fdf4", "border": "#22c55e", "text": "#15803d"},
+    "yellow": {"bg": "#fefce8", "border": "#eab308", "text": "#a16207"},
+    "red": {"bg": "#fef2f2", "border": "#ef4444", "text": "#b91c1c"},
+}
+
+
 def metric_card(
     label: str,
     value: str,
@@ -47,24 +100,18 @@ def stat_card(title: str, value: str, icon: str = "📊", description: Optional[
     Usage:
         stat_card("Revenue This Month", "$24,567", "💰", "Up 15% from last month")
     """
-    st.markdown(
-        f"""
-        <div style="padding: 1.5rem; background: white; border-radius: 0.5rem;
-                    border: 1px solid #e5e7eb; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-            <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                <span style="font-size: 1.5rem;">{icon}</span>
-                <h3 style="margin: 0; color: #1f2937; font-size: 0.875rem; font-weight: 600;">
-                    {title}
-                </h3>
-            </div>
-            <div style="font-size: 2rem; font-weight: 700; color: #111827; margin-bottom: 0.25rem;">
-                {value}
-            </div>
-            {f'<div style="color: #6b7280; font-size: 0.875rem;">{description}</div>' if description else ''}
-        </div>
-        """,
-        unsafe_allow_html=True
+    st.markdown(_stat_card_html(title, value, icon, description), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=128)
+def _stat_card_html(title: str, value: str, icon: str, description: Optional[str]) -> str:
+    """Build (and memoize) the stat card HTML for a given set of arguments."""
+    description_html = (
+        _STAT_CARD_DESCRIPTION_TEMPLATE.format_map({"description": description}) if description else ""
     )
+    return _STAT_CARD_TEMPLATE.format_map({
+        "icon": icon, "title": title, "value": value, "description_html": description_html
+    })
 
 
 def info_card(title: str, content: str, icon: str = "ℹ️", color: str = "blue"):
@@ -80,34 +127,14 @@ def info_card(title: str, content: str, icon: str = "ℹ️", color: str = "blue
     Usage:
         info_card("Note", "This is read-only", "⚠️", "yellow")
     """
-    color_map = {
-        "blue": {"bg": "#eff6ff", "border": "#3b82f6", "text": "#1e40af"},
-        "green": {"bg": "#f0fdf4", "border": "#22c55e", "text": "#15803d"},
-        "yellow": {"bg": "#fefce8", "border": "#eab308", "text": "#a16207"},
-        "red": {"bg": "#fef2f2", "border": "#ef4444", "text": "#b91c1c"},
-    }
-
-    colors = color_map.get(color, color_map["blue"])
-
-    st.markdown(
-        f"""
-        <div style="padding: 1rem; background: {colors['bg']}; border-radius: 0.5rem;
-                    border-left: 4px solid {colors['border']}; margin: 1rem 0;">
-            <div style="display: flex; align-items: flex-start; gap: 0.75rem;">
-                <span style="font-size: 1.25rem;">{icon}</span>
-                <div>
-                    <div style="font-weight: 600; color: {colors['text']}; margin-bottom: 0.25rem;">
-                        {title}
-                    </div>
-                    <div style="color: {colors['text']}; font-size: 0.875rem;">
-                        {content}
-                    </div>
-                </div>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_info_card_html(title, content, icon, color), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=128)
+def _info_card_html(title: str, content: str, icon: str, color: str) -> str:
+    """Build (and memoize) the info card HTML for a given set of arguments."""
+    colors = _INFO_CARD_COLORS.get(color, _INFO_CARD_COLORS["blue"])
+    return _INFO_CARD_TEMPLATE.format_map({"icon": icon, "title": title, "content": content, **colors})
 
 
 def alert_card(message: str, type: str = "info", dismissible: bool = False):
@@ -2,12 +2,166 @@
 Carrier instructions component for displaying call forwarding setup.
 """
 import streamlit as st
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 import logging
 import time
+from services.carrier_service import get_carrier_instructions, research_carrier_for_business
 
 logger = logging.getLogger(__name__)
 
+# How long carrier lookups are shared across all sessions (seconds). Carrier
+# instructions for a number are stable for hours; research is an expensive AI
+# call whose outcome only changes if the carrier data does.
+INSTRUCTIONS_TTL_SECONDS = 3600
+RESEARCH_TTL_SECONDS = 86400
+
+# Badge text shown under the carrier name, by carrier type
+_TYPE_COLORS = {
+    "cellular": "🔵 Cellular",
+    "voip": "🟢 VoIP",
+    "landline": "🟡 Landline"
+}
+
+# Conditional forwarding scenarios in display order: (instructions key, label)
+_COND_ROWS = (
+    ("busy", "When Busy"),
+    ("no_answer", "When No Answer"),
+    ("unreachable", "When Unreachable"),
+)
+
+
+class _LookupFailed(Exception):
+    """Raised inside cached lookups so failures are not cached"""
+
+
+@st.cache_data(ttl=INSTRUCTIONS_TTL_SECONDS, show_spinner="Loading carrier instructions...")
+def _cached_carrier_instructions(business_id: str, phone_e164: str) -> Dict[str, Any]:
+    """
+    Fetch carrier instructions, shared across sessions.
+
+    The phone number is part of the cache key so a changed number is
+    looked up again.
+
+    Raises:
+        _LookupFailed: If the backend returned nothing (not cached)
+    """
+    instructions = get_carrier_instructions(business_id)
+    if not instructions:
+        raise _LookupFailed(business_id)
+    return instructions
+
+
+@st.cache_data(ttl=RESEARCH_TTL_SECONDS, show_spinner=False)
+def _cached_carrier_research(phone_e164: str, _business_id: str) -> Tuple[float, Dict[str, Any]]:
+    """
+    Research carrier instructions, shared across sessions by phone number.
+
+    Returns:
+        (time the research ran, research response); the timestamp tells
+        callers whether the result came from the cache
+
+    Raises:
+        _LookupFailed: If research failed (not cached)
+    """
+    result = research_carrier_for_business(_business_id)
+    if result is None:
+        raise _LookupFailed(_business_id)
+    return time.time(), result
+
+
+@st.cache_data(ttl=INSTRUCTIONS_TTL_SECONDS, show_spinner=False)
+def _cached_instruction_blocks(business_id: str, phone_e164: str) -> Dict[str, Optional[str]]:
+    """
+    Carrier instructions pre-rendered to markdown, shared across sessions.
+
+    Reruns with unchanged instructions reuse these strings instead of
+    re-formatting every section.
+
+    Raises:
+        _LookupFailed: If instructions are not available (not cached)
+    """
+    return _build_instruction_blocks(_cached_carrier_instructions(business_id, phone_e164))
+
+
+def _build_instruction_blocks(instructions: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Format each section of the instructions as one markdown string.
+
+    Args:
+        instructions: Carrier instructions from the backend
+
+    Returns:
+        Dict with header, setup, notes, conditional, disable and help
+        markdown (None for sections with nothing to show)
+    """
+    # Carrier name and type (type as a badge-like line under the name)
+    carrier_name = instructions.get("carrier_name", "Unknown Carrier")
+    carrier_type = instructions.get("carrier_type", "")
+    if carrier_type:
+        badge = _TYPE_COLORS.get(carrier_type, f"• {carrier_type.title()}")
+        header = f"**Carrier:** {carrier_name}\n\n_{badge}_\n\n---"
+    else:
+        header = f"**Carrier:** {carrier_name}\n\n---"
+
+    # Dialer code takes precedence over manual steps
+    setup_code = instructions.get("setup_code")
+    setup_steps = instructions.get("setup_steps")
+    setup = None
+    if setup_code:
+        setup = (
+            f"**Dial this code from the business phone:**\n\n```\n{setup_code}\n```\n\n"
+            "_☝️ This code will forward calls to the AICallGO number_"
+        )
+    elif setup_steps:
+        setup = "**Follow these steps:**\n\n" + "\n".join(
+            f"{i}. {step}" for i, step in enumerate(setup_steps, 1)
+        )
+
+    notes = instructions.get("notes", [])
+
+    # Only scenarios the carrier supports
+    conditional = instructions.get("conditional_options") or {}
+    parts = []
+    for key, label in _COND_ROWS:
+        entry = conditional.get(key) or {}
+        if not entry.get("supported"):
+            continue
+        code = entry.get("code")
+        parts.append(
+            f"**{label}:**\n\n"
+            + (f"```\n{code}\n```" if code else "_Supported (check carrier for code)_")
+        )
+
+    disable_code = instructions.get("disable_code")
+    help_url = instructions.get("help_url")
+
+    return {
+        "header": header,
+        "setup": setup,
+        "notes": "\n".join(f"- {note}" for note in notes) if notes else None,
+        "conditional": "\n\n".join(parts) if parts else None,
+        "disable": f"To turn off call forwarding, dial:\n\n```\n{disable_code}\n```" if disable_code else None,
+        "help": f"---\n\n📚 [Carrier Support Documentation]({help_url})" if help_url else None,
+    }
+
+
+def _load_carrier_instructions(business_id: str, phone_e164: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Fetch pre-rendered carrier instructions for a business via the shared cache.
+
+    Args:
+        business_id: UUID of the business
+        phone_e164: Business primary phone number
+
+    Returns:
+        Markdown blocks from _build_instruction_blocks, or None if not available
+    """
+    try:
+        return _cached_instruction_blocks(business_id, phone_e164)
+    except _LookupFailed:
+        return None
+
 
 def render_carrier_research_section(business: Any):
     """
@@ -22,8 +176,6 @@ def render_carrier_research_section(business: Any):
         - Loading state during research (30+ seconds possible)
         - Success/warning/error messages
     """
-    from services.carrier_service import research_carrier_for_business
-
     # Check if business has primary phone number
     if not business.primary_business_phone_number:
         return  # Don't show anything if no phone number
@@ -38,62 +190,155 @@ def render_carrier_research_section(business: Any):
         st.caption("This ensures call forwarding instructions can be displayed correctly")
 
     with col2:
-        # Research button
-        if st.button("Research Carrier", use_container_width=True, type="primary"):
-            # Store button click in session state
-            st.session_state['research_clicked'] = True
-            st.session_state['research_result'] = None
+        # Research button (disabled while a research request is in flight)
+        if st.button(
+            "Research Carrier",
+            use_container_width=True,
+            type="primary",
+            disabled=_research_pending(),
+        ):
+            _start_research(str(business.id), business.primary_business_phone_number)
+
+    # Poll once a second only while research is running in the background
+    polling = _research_pending()
+    st.fragment(_render_research_status, run_every=1 if polling else None)(
+        str(business.id), business.primary_business_phone_number, polling
+    )
+
+
+@st.cache_resource
+def _research_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for long-running carrier research requests"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="carrier-research")
+
+
+def _timed_research(
+    business_id: str, phone_e164: str
+) -> Tuple[Optional[Dict[str, Any]], float, bool]:
+    """Run carrier research and return (result, elapsed seconds, from cache)"""
+    start_time = time.time()
+    try:
+        researched_at, result = _cached_carrier_research(phone_e164, business_id)
+    except _LookupFailed:
+        return None, time.time() - start_time, False
+    return result, time.time() - start_time, researched_at < start_time
+
+
+def _start_research(business_id: str, phone_e164: str):
+    """Submit carrier research to the worker pool unless one is already running"""
+    if _research_pending():
+        return
+    st.session_state['research_future'] = _research_executor().submit(
+        _timed_research, business_id, phone_e164
+    )
+    st.session_state['research_started'] = time.time()
+
+
+def _research_pending() -> bool:
+    """True while a submitted research request has not finished"""
+    future = st.session_state.get('research_future')
+    return future is not None and not future.done()
+
+
+def _format_research_result(
+    result: Optional[Dict[str, Any]], elapsed_time: float, from_cache: bool = False
+) -> Optional[Tuple[str, str]]:
+    """
+    Build the status message for a research result.
+
+    Args:
+        result: Research response, or None on failure
+        elapsed_time: Seconds the research request took
+        from_cache: Whether the result is a cached earlier research
+
+    Returns:
+        (streamlit element name, markdown text), or None for a failed attempt
+    """
+    if not result:
+        return None
+
+    carrier_name = result.get("carrier_name", "Unknown")
+    message = result.get("message", "")
+
+    if result.get("was_researched", False) and from_cache:
+        # Research ran earlier (possibly in another session); no timing to show
+        return (
+            "info",
+            f"ℹ️ Cached research result: {message}\n\n**Carrier:** {carrier_name}"
+        )
 
-    # Handle research action
-    if st.session_state.get('research_clicked', False):
-        # Show loading state
-        with st.spinner("🔬 Researching carrier instructions... This may take up to 60 seconds"):
-            start_time = time.time()
+    if result.get("was_researched", False):
+        # New research was performed
+        return (
+            "success",
+            f"✓ {message}\n\n"
+            f"**Carrier:** {carrier_name}\n\n"
+            f"**Research time:** {elapsed_time:.1f} seconds"
+        )
 
-            # Call research endpoint
-            result = research_carrier_for_business(str(business.id))
+    # Instructions already existed
+    return "info", f"ℹ️ {message}\n\n**Carrier:** {carrier_name}"
 
-            elapsed_time = time.time() - start_time
 
-            # Store result in session state
-            st.session_state['research_result'] = result
-            st.session_state['research_elapsed_time'] = elapsed_time
+def _render_research_status(business_id: str, phone_e164: str, polling: bool):
+    """
+    Render research progress or outcome (runs as a fragment).
 
-        # Clear the clicked state
-        st.session_state['research_clicked'] = False
+    Args:
+        business_id: UUID of the business being researched
+        phone_e164: Business primary phone number
+        polling: Whether this fragment was scheduled with a refresh timer
+    """
+    # Clear/Retry are rendered inside this fragment, so their clicks rerun
+    # only the fragment and are handled here before anything is drawn
+    if st.session_state.get("carrier_research_clear"):
+        st.session_state['research_result'] = None
+    if st.session_state.get("carrier_research_retry"):
+        _start_research(business_id, phone_e164)
+
+    # Collect a finished request
+    future = st.session_state.get('research_future')
+    if future is not None and future.done():
+        del st.session_state['research_future']
+        try:
+            result, elapsed_time, from_cache = future.result()
+        except Exception as e:
+            logger.error(f"Carrier research failed for business {business_id}: {e}")
+            result, elapsed_time, from_cache = (
+                None, time.time() - st.session_state['research_started'], False
+            )
 
-        # Force rerun to show result
+        # Store result in session state ({} marks a failed attempt), with its
+        # message formatted once here rather than on every redisplay
+        st.session_state['research_result'] = result if result is not None else {}
+        st.session_state['research_rendered'] = _format_research_result(
+            result, elapsed_time, from_cache
+        )
+
+    # Start or stop the refresh timer when research began or ended since the
+    # fragment was scheduled (run_every is fixed until the next full run)
+    if _research_pending() != polling:
         st.rerun()
 
+    if _research_pending():
+        waited = time.time() - st.session_state['research_started']
+        st.info(
+            f"🔬 Researching carrier instructions... {waited:.0f}s elapsed "
+            "(this may take up to 60 seconds)"
+        )
+        return
+
     # Display research result if available
     if st.session_state.get('research_result') is not None:
         result = st.session_state['research_result']
-        elapsed_time = st.session_state.get('research_elapsed_time', 0)
 
         if result:
-            # Success
-            carrier_name = result.get("carrier_name", "Unknown")
-            was_researched = result.get("was_researched", False)
-            message = result.get("message", "")
-
-            if was_researched:
-                # New research was performed
-                st.success(
-                    f"✓ {message}\n\n"
-                    f"**Carrier:** {carrier_name}\n\n"
-                    f"**Research time:** {elapsed_time:.1f} seconds"
-                )
-            else:
-                # Instructions already existed
-                st.info(
-                    f"ℹ️ {message}\n\n"
-                    f"**Carrier:** {carrier_name}"
-                )
-
-            # Add clear button
-            if st.button("Clear Result", use_container_width=True):
-                st.session_state['research_result'] = None
-                st.rerun()
+            # Success: "success" for new research, "info" if it already existed
+            kind, text = st.session_state['research_rendered']
+            getattr(st, kind)(text)
+
+            # Add clear button (handled at the top of the next fragment run)
+            st.button("Clear Result", use_container_width=True, key="carrier_research_clear")
 
         else:
             # Error or no result
@@ -106,11 +351,8 @@ def render_carrier_research_section(business: Any):
                 "- Request timeout"
             )
 
-            # Add retry button
-            if st.button("Retry", use_container_width=True):
-                st.session_state['research_clicked'] = True
-                st.session_state['research_result'] = None
-                st.rerun()
+            # Add retry button (handled at the top of the next fragment run)
+            st.button("Retry", use_container_width=True, key="carrier_research_retry")
 
 
 def render_carrier_instructions(business: Any):
@@ -129,17 +371,15 @@ def render_carrier_instructions(business: Any):
         - Disable methods (collapsible)
         - Help link to carrier support
     """
-    from services.carrier_service import get_carrier_instructions
-    from utils.formatters import format_phone
-
     # Check if business has primary phone number
     if not business.primary_business_phone_number:
         return  # Don't show anything if no phone number
 
     # Use expander (collapsed by default)
     with st.expander("📞 Call Forwarding Instructions", expanded=False):
-        with st.spinner("Loading carrier instructions..."):
-            instructions = get_carrier_instructions(str(business.id))
+        instructions = _load_carrier_instructions(
+            str(business.id), business.primary_business_phone_number
+        )
 
         if not instructions:
             st.warning(
@@ -148,98 +388,35 @@ def render_carrier_instructions(business: Any):
             )
             return
 
-        # Display carrier name and type
-        carrier_name = instructions.get("carrier_name", "Unknown Carrier")
-        carrier_type = instructions.get("carrier_type", "")
-
-        st.markdown(f"**Carrier:** {carrier_name}")
-        if carrier_type:
-            # Display carrier type as a badge-like element
-            type_colors = {
-                "cellular": "🔵 Cellular",
-                "voip": "🟢 VoIP",
-                "landline": "🟡 Landline"
-            }
-            st.caption(type_colors.get(carrier_type, f"• {carrier_type.title()}"))
-
-        st.markdown("---")
+        # Carrier name and type
+        st.markdown(instructions["header"])
 
         # Primary setup method
         st.markdown("### Primary Setup Method")
-
-        setup_code = instructions.get("setup_code")
-        setup_steps = instructions.get("setup_steps")
-
-        if setup_code:
-            # Display dialer code prominently
-            st.markdown("**Dial this code from the business phone:**")
-            st.code(setup_code, language=None)
-            st.caption("☝️ This code will forward calls to the AICallGO number")
-
-        elif setup_steps:
-            # Display manual steps
-            st.markdown("**Follow these steps:**")
-            for i, step in enumerate(setup_steps, 1):
-                st.markdown(f"{i}. {step}")
+        if instructions["setup"]:
+            st.markdown(instructions["setup"])
         else:
             st.info("No setup instructions available for this carrier.")
 
         # Important notes (collapsible)
-        notes = instructions.get("notes", [])
-        if notes:
+        if instructions["notes"]:
             with st.expander("⚠️ Important Notes", expanded=False):
-                for note in notes:
-                    st.markdown(f"- {note}")
+                st.markdown(instructions["notes"])
 
         # Conditional forwarding options (collapsible)
-        conditional = instructions.get("conditional_options")
-        if conditional:
-            has_conditional = any([
-                conditional.get("busy", {}).get("supported"),
-                conditional.get("no_answer", {}).get("supported"),
-                conditional.get("unreachable", {}).get("supported")
-            ])
-
-            if has_conditional:
-                with st.expander("🔀 Advanced: Conditional Forwarding", expanded=False):
-                    st.caption("Forward calls only in specific scenarios:")
-
-                    if conditional.get("busy", {}).get("supported"):
-                        code = conditional["busy"].get("code")
-                        st.markdown("**When Busy:**")
-                        if code:
-                            st.code(code, language=None)
-                        else:
-                            st.caption("Supported (check carrier for code)")
-
-                    if conditional.get("no_answer", {}).get("supported"):
-                        code = conditional["no_answer"].get("code")
-                        st.markdown("**When No Answer:**")
-                        if code:
-                            st.code(code, language=None)
-                        else:
-                            st.caption("Supported (check carrier for code)")
-
-                    if conditional.get("unreachable", {}).get("supported"):
-                        code = conditional["unreachable"].get("code")
-                        st.markdown("**When Unreachable:**")
-                        if code:
-                            st.code(code, language=None)
-                        else:
-                            st.caption("Supported (check carrier for code)")
+        if instructions["conditional"]:
+            with st.expander("🔀 Advanced: Conditional Forwarding", expanded=False):
+                st.caption("Forward calls only in specific scenarios:")
+                st.markdown(instructions["conditional"])
 
         # Disable forwarding (collapsible)
-        disable_code = instructions.get("disable_code")
-        if disable_code:
+        if instructions["disable"]:
             with st.expander("🚫 Disable Call Forwarding", expanded=False):
-                st.markdown("To turn off call forwarding, dial:")
-                st.code(disable_code, language=None)
+                st.markdown(instructions["disable"])
 
         # Help link
-        help_url = instructions.get("help_url")
-        if help_url:
-            st.markdown("---")
-            st.markdown(f"📚 [Carrier Support Documentation]({help_url})")
+        if instructions["help"]:
+            st.markdown(instructions["help"])
 
         # Success message at the bottom
         st.success(
@@ -7,6 +7,18 @@ All sections are visible (not collapsible) with clear visual organization.
 import streamlit as st
 from typing import Dict, Any, Optional
 
+# Conditional forwarding scenarios in display order: (result key, heading)
+_COND_ROWS = (
+    ("busy", "When Line is Busy"),
+    ("no_answer", "When No Answer"),
+    ("unreachable", "When Unreachable"),
+)
+
+
+def _table_cell(value: Any) -> str:
+    """Make a value safe for a markdown table cell (no line or column breaks)"""
+    return " ".join(str(value).split()).replace("|", "\\|")
+
 
 def render_carrier_lookup_result(result: Dict[str, Any]) -> None:
     """
@@ -43,14 +55,14 @@ def render_carrier_lookup_result(result: Dict[str, Any]) -> None:
     st.markdown("---")
     st.subheader("📱 Carrier Information")
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Carrier Name", carrier_name)
-    with col2:
-        carrier_type_display = carrier_type.upper() if carrier_type else "UNKNOWN"
-        st.metric("Carrier Type", carrier_type_display)
-    with col3:
-        st.metric("Carrier Key", carrier_key)
+    # Single table element instead of a column layout with one st.metric each
+    carrier_type_display = carrier_type.upper() if carrier_type else "UNKNOWN"
+    st.markdown(
+        "| Carrier Name | Carrier Type | Carrier Key |\n"
+        "|---|---|---|\n"
+        f"| {_table_cell(carrier_name)} | {_table_cell(carrier_type_display)} "
+        f"| `{_table_cell(carrier_key)}` |"
+    )
 
     if phone_number:
         st.info(f"**Phone Number Searched**: {phone_number}")
@@ -64,14 +76,16 @@ def render_carrier_lookup_result(result: Dict[str, Any]) -> None:
         st.subheader("🔧 Setup Instructions")
 
         if setup_code:
-            st.markdown(f"**Dialer Code**:")
-            st.code(setup_code, language=None)
-            st.caption("Dial this code from your phone to enable call forwarding")
+            st.markdown(
+                f"**Dialer Code**:\n\n```\n{setup_code}\n```\n\n"
+                "_Dial this code from your phone to enable call forwarding_"
+            )
 
         if setup_steps:
-            st.markdown("**Step-by-Step Instructions**:")
-            for i, step in enumerate(setup_steps, 1):
-                st.markdown(f"{i}. {step}")
+            st.markdown(
+                "**Step-by-Step Instructions**:\n\n"
+                + "\n".join(f"{i}. {step}" for i, step in enumerate(setup_steps, 1))
+            )
 
     # === CONDITIONAL FORWARDING SECTION ===
     conditional_options = result.get("conditional_options")
@@ -80,40 +94,17 @@ def render_carrier_lookup_result(result: Dict[str, Any]) -> None:
         st.markdown("---")
         st.subheader("🔀 Conditional Forwarding Options")
 
-        st.markdown("Set up forwarding based on specific conditions:")
-
-        # Busy forwarding
-        if "busy" in conditional_options:
-            busy = conditional_options["busy"]
-            with st.container():
-                st.markdown("**When Line is Busy**")
-                if busy.get("supported"):
-                    code = busy.get("code", "Not available")
-                    st.code(code, language=None)
-                else:
-                    st.caption("❌ Not supported by this carrier")
-
-        # No answer forwarding
-        if "no_answer" in conditional_options:
-            no_answer = conditional_options["no_answer"]
-            with st.container():
-                st.markdown("**When No Answer**")
-                if no_answer.get("supported"):
-                    code = no_answer.get("code", "Not available")
-                    st.code(code, language=None)
-                else:
-                    st.caption("❌ Not supported by this carrier")
-
-        # Unreachable forwarding
-        if "unreachable" in conditional_options:
-            unreachable = conditional_options["unreachable"]
-            with st.container():
-                st.markdown("**When Unreachable**")
-                if unreachable.get("supported"):
-                    code = unreachable.get("code", "Not available")
-                    st.code(code, language=None)
-                else:
-                    st.caption("❌ Not supported by this carrier")
+        parts = ["Set up forwarding based on specific conditions:"]
+        for key, label in _COND_ROWS:
+            entry = conditional_options.get(key)
+            if entry is None:
+                continue
+            if entry.get("supported"):
+                body = f"```\n{entry.get('code', 'Not available')}\n```"
+            else:
+                body = "_❌ Not supported by this carrier_"
+            parts.append(f"**{label}**\n\n{body}")
+        st.markdown("\n\n".join(parts))
 
     # === DISABLE INSTRUCTIONS SECTION ===
     disable_code = result.get("disable_code")
@@ -122,19 +113,20 @@ def render_carrier_lookup_result(result: Dict[str, Any]) -> None:
         st.markdown("---")
         st.subheader("❌ Disable Call Forwarding")
 
-        st.markdown(f"**Disable Code**:")
-        st.code(disable_code, language=None)
-        st.caption("Dial this code from your phone to turn off call forwarding")
+        st.markdown(
+            f"**Disable Code**:\n\n```\n{disable_code}\n```\n\n"
+            "_Dial this code from your phone to turn off call forwarding_"
+        )
 
     # === IMPORTANT NOTES SECTION ===
     notes = result.get("notes")
 
-    if notes and len(notes) > 0:
+    if notes:
         st.markdown("---")
         st.subheader("📋 Important Notes")
 
-        for note in notes:
-            st.warning(note)
+        # One callout for all notes rather than one per note
+        st.warning("\n\n".join(f"• {note}" for note in notes))
 
     # === HELP & SUPPORT SECTION ===
     help_url = result.get("help_url")
@@ -143,8 +135,10 @@ def render_carrier_lookup_result(result: Dict[str, Any]) -> None:
         st.markdown("---")
         st.subheader("🆘 Need Help?")
 
-        st.markdown(f"For additional support, visit the carrier's help page:")
-        st.markdown(f"[{carrier_name} Support]({help_url})")
+        st.markdown(
+            "For additional support, visit the carrier's help page:\n\n"
+            f"[{carrier_name} Support]({help_url})"
+        )
 
 
 def render_carrier_not_found() -> None:
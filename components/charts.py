@@ -2,10 +2,12 @@
 Chart components using Plotly with custom theme.
 """
 import streamlit as st
+from itertools import cycle
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Mapping, Sequence, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # Custom theme matching nextjs-frontend
@@ -17,9 +19,36 @@ CHART_THEME = {
     "text": "#1f2937",
 }
 
+# Layout shared by every chart (plotly copies it on use, so it is built once
+# here). Axis grids are part of it, so each chart needs a single
+# update_layout call. These are real layout values rather than a plotly
+# template: st.plotly_chart's "streamlit" theme rewrites layout.template in
+# the browser and would override them.
+_GRID_AXIS = dict(showgrid=True, gridcolor=CHART_THEME["grid"])
+_BASE_LAYOUT = dict(
+    plot_bgcolor=CHART_THEME["background"],
+    paper_bgcolor=CHART_THEME["background"],
+    font=dict(color=CHART_THEME["text"]),
+    xaxis=_GRID_AXIS,
+    yaxis=_GRID_AXIS,
+)
+_PRIMARY_MARKER = dict(color=CHART_THEME["primary"])
+_SERIES_COLORS = (CHART_THEME["primary"], CHART_THEME["secondary"])
+
+# Chart data: a DataFrame, or any mapping of column name -> values (e.g. a dict
+# of lists) so callers that already hold plain sequences skip building a frame
+ChartData = Union["pd.DataFrame", Mapping[str, Sequence]]
+
+
+def _column(data: ChartData, name: str):
+    """Column values in a form plotly takes without conversion"""
+    values = data[name]
+    # Series -> ndarray without importing pandas here
+    return values.to_numpy() if hasattr(values, "to_numpy") else values
+
 
 def line_chart(
-    df: pd.DataFrame,
+    df: ChartData,
     x_column: str,
     y_column: str,
     title: str,
@@ -31,7 +60,7 @@ def line_chart(
     Create a line chart.
 
     Args:
-        df: DataFrame with data
+        df: DataFrame, or mapping of column name to values
         x_column: X-axis column name
         y_column: Y-axis column name
         title: Chart title
@@ -42,37 +71,31 @@ def line_chart(
     Usage:
         line_chart(calls_df, "date", "count", "Calls Over Time")
     """
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatter(
-        x=df[x_column],
-        y=df[y_column],
-        mode='lines+markers',
-        line=dict(color=CHART_THEME["primary"], width=2),
-        marker=dict(size=6, color=CHART_THEME["primary"]),
-        name=y_column
-    ))
-
-    fig.update_layout(
-        title=title,
-        xaxis_title=x_title or x_column,
-        yaxis_title=y_title or y_column,
-        height=height,
-        plot_bgcolor=CHART_THEME["background"],
-        paper_bgcolor=CHART_THEME["background"],
-        font=dict(color=CHART_THEME["text"]),
-        hovermode='x unified',
-        showlegend=False
+    fig = go.Figure(
+        data=[go.Scatter(
+            x=_column(df, x_column),
+            y=_column(df, y_column),
+            mode='lines+markers',
+            line=dict(color=CHART_THEME["primary"], width=2),
+            marker=dict(_PRIMARY_MARKER, size=6),
+            name=y_column
+        )],
+        layout=dict(
+            title=title,
+            height=height,
+            **_BASE_LAYOUT,
+            xaxis_title=x_title or x_column,
+            yaxis_title=y_title or y_column,
+            hovermode='x unified',
+            showlegend=False
+        )
     )
 
-    fig.update_xaxes(showgrid=True, gridcolor=CHART_THEME["grid"])
-    fig.update_yaxes(showgrid=True, gridcolor=CHART_THEME["grid"])
-
     st.plotly_chart(fig, use_container_width=True)
 
 
 def bar_chart(
-    df: pd.DataFrame,
+    df: ChartData,
     x_column: str,
     y_column: str,
     title: str,
@@ -83,7 +106,7 @@ def bar_chart(
     Create a bar chart.
 
     Args:
-        df: DataFrame with data
+        df: DataFrame, or mapping of column name to values
         x_column: X-axis column name
         y_column: Y-axis column name
         title: Chart title
@@ -93,39 +116,35 @@ def bar_chart(
     Usage:
         bar_chart(industry_df, "industry", "count", "Users by Industry")
     """
-    fig = go.Figure()
-
     if orientation == "v":
-        fig.add_trace(go.Bar(
-            x=df[x_column],
-            y=df[y_column],
-            marker=dict(color=CHART_THEME["primary"])
-        ))
+        trace = go.Bar(
+            x=_column(df, x_column),
+            y=_column(df, y_column),
+            marker=_PRIMARY_MARKER
+        )
     else:
-        fig.add_trace(go.Bar(
-            y=df[x_column],
-            x=df[y_column],
-            marker=dict(color=CHART_THEME["primary"]),
+        trace = go.Bar(
+            y=_column(df, x_column),
+            x=_column(df, y_column),
+            marker=_PRIMARY_MARKER,
             orientation='h'
-        ))
-
-    fig.update_layout(
-        title=title,
-        height=height,
-        plot_bgcolor=CHART_THEME["background"],
-        paper_bgcolor=CHART_THEME["background"],
-        font=dict(color=CHART_THEME["text"]),
-        showlegend=False
+        )
+
+    fig = go.Figure(
+        data=[trace],
+        layout=dict(
+            title=title,
+            height=height,
+            **_BASE_LAYOUT,
+            showlegend=False
+        )
     )
 
-    fig.update_xaxes(showgrid=True, gridcolor=CHART_THEME["grid"])
-    fig.update_yaxes(showgrid=True, gridcolor=CHART_THEME["grid"])
-
     st.plotly_chart(fig, use_container_width=True)
 
 
 def area_chart(
-    df: pd.DataFrame,
+    df: ChartData,
     x_column: str,
     y_columns: List[str],
     title: str,
@@ -136,7 +155,7 @@ def area_chart(
     Create an area chart (useful for trends over time).
 
     Args:
-        df: DataFrame with data
+        df: DataFrame, or mapping of column name to values
         x_column: X-axis column name
         y_columns: List of Y-axis column names
         title: Chart title
@@ -146,38 +165,34 @@ def area_chart(
     Usage:
         area_chart(revenue_df, "date", ["mrr", "one_time"], "Revenue Trend")
     """
-    fig = go.Figure()
-
-    colors = [CHART_THEME["primary"], CHART_THEME["secondary"]]
-
-    for idx, y_col in enumerate(y_columns):
-        fig.add_trace(go.Scatter(
-            x=df[x_column],
-            y=df[y_col],
-            mode='lines',
-            name=y_col,
-            stackgroup='one' if stacked else None,
-            fillcolor=colors[idx % len(colors)],
-            line=dict(width=0.5, color=colors[idx % len(colors)])
-        ))
-
-    fig.update_layout(
-        title=title,
-        height=height,
-        plot_bgcolor=CHART_THEME["background"],
-        paper_bgcolor=CHART_THEME["background"],
-        font=dict(color=CHART_THEME["text"]),
-        hovermode='x unified'
+    x = _column(df, x_column)
+
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=x,
+                y=_column(df, y_col),
+                mode='lines',
+                name=y_col,
+                stackgroup='one' if stacked else None,
+                fillcolor=color,
+                line=dict(width=0.5, color=color)
+            )
+            for y_col, color in zip(y_columns, cycle(_SERIES_COLORS))
+        ],
+        layout=dict(
+            title=title,
+            height=height,
+            **_BASE_LAYOUT,
+            hovermode='x unified'
+        )
     )
 
-    fig.update_xaxes(showgrid=True, gridcolor=CHART_THEME["grid"])
-    fig.update_yaxes(showgrid=True, gridcolor=CHART_THEME["grid"])
-
     st.plotly_chart(fig, use_container_width=True)
 
 
 def pie_chart(
-    df: pd.DataFrame,
+    df: ChartData,
     labels_column: str,
     values_column: str,
     title: str,
@@ -188,7 +203,7 @@ def pie_chart(
     Create a pie or donut chart.
 
     Args:
-        df: DataFrame with data
+        df: DataFrame, or mapping of column name to values
         labels_column: Column with labels
         values_column: Column with values
         title: Chart title
@@ -198,20 +213,19 @@ def pie_chart(
     Usage:
         pie_chart(plan_df, "plan_name", "user_count", "Users by Plan")
     """
-    fig = go.Figure()
-
-    fig.add_trace(go.Pie(
-        labels=df[labels_column],
-        values=df[values_column],
-        hole=0.4 if donut else 0,
-        marker=dict(colors=[CHART_THEME["primary"], CHART_THEME["secondary"]])
-    ))
-
-    fig.update_layout(
-        title=title,
-        height=height,
-        paper_bgcolor=CHART_THEME["background"],
-        font=dict(color=CHART_THEME["text"])
+    fig = go.Figure(
+        data=[go.Pie(
+            labels=_column(df, labels_column),
+            values=_column(df, values_column),
+            hole=0.4 if donut else 0,
+            marker=dict(colors=list(_SERIES_COLORS))
+        )],
+        layout=dict(
+            title=title,
+            height=height,
+            paper_bgcolor=_BASE_LAYOUT["paper_bgcolor"],
+            font=_BASE_LAYOUT["font"]
+        )
     )
 
     st.plotly_chart(fig, use_container_width=True)
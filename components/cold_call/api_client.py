@@ -1,18 +1,224 @@
 """API client for outcall-agent cold call endpoints."""
+import asyncio
+import concurrent.futures
 import os
 import logging
-from typing import Dict, Any, Optional
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple, TypedDict, Union
 import httpx
-from config.settings import settings
+import orjson
 
 logger = logging.getLogger(__name__)
 
+def _backoff_delay(attempt: int, base_ms: int, cap_ms: int) -> float:
+    """Exponential backoff with jitter, in seconds, before retry number `attempt`."""
+    return min(cap_ms, base_ms * 2 ** (attempt - 1)) / 1000.0 * random.uniform(0.5, 1.5)
+
+
+def _dumps(body: Any) -> bytes:
+    """Encode a request body with orjson, omitting top-level None fields.
+
+    Lets endpoints build each payload as one dict literal, with unset
+    optional fields left as None instead of added conditionally.
+    """
+    if isinstance(body, dict):
+        body = {key: value for key, value in body.items() if value is not None}
+    return orjson.dumps(body)
+
+
+# Responses and transport errors worth retrying on idempotent requests
+_TRANSIENT_STATUS_CODES = (502, 503, 504)
+_TRANSIENT_ERRORS = (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError)
+
+
+def _is_transient(error: httpx.HTTPError, retry_on: tuple) -> bool:
+    """Whether a failed request may succeed if sent again."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in retry_on
+    return isinstance(error, _TRANSIENT_ERRORS)
+
+
+def _audio_player_retry_delay(
+    error: httpx.HTTPError,
+    attempt: int,
+    max_attempts: int,
+    delay_ms: int,
+    max_delay_ms: int,
+    retry_server_errors: bool,
+) -> Optional[float]:
+    """Seconds to wait before retrying add_audio_player, or None to give up.
+
+    Retries 404 (conference not ready yet), connect errors and read timeouts,
+    and 5xx responses only when retry_server_errors is set.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if status_code != 404 and not (retry_server_errors and status_code >= 500):
+            logger.error("HTTP error %d, not retrying", status_code)
+            return None
+        if attempt == max_attempts:
+            logger.error("Conference not ready after %d attempts", max_attempts)
+            return None
+
+        delay = _backoff_delay(attempt, delay_ms, max_delay_ms)
+        logger.info(
+            "Conference not ready, retrying in %.0fms (attempt %d/%d)",
+            delay * 1000, attempt, max_attempts,
+        )
+        return delay
+
+    # Transient network errors
+    if attempt == max_attempts:
+        logger.error("Failed after %d attempts: %s", max_attempts, error)
+        return None
+
+    logger.warning("Error on attempt %d: %s, retrying...", attempt, error)
+    return _backoff_delay(attempt, delay_ms, max_delay_ms)
+
+
+# Requests are small JSON bodies to a sibling service: disable Nagle so they
+# go out immediately, and keep idle pooled connections alive through NAT and
+# load-balancer idle timeouts between calls
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux (and macOS on newer Pythons)
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4),
+    ]
+
+
+# Response shapes of the outcall-agent endpoints. Bodies are decoded with
+# orjson into plain dicts; these describe the keys callers rely on (servers may
+# omit some or send more).
+class InitiateCallResponse(TypedDict, total=False):
+    conference_sid: str
+    conference_id: str
+    call_sid: str
+
+
+class WebRTCJoinResponse(TypedDict, total=False):
+    participant_sid: str
+    access_token: str  # Twilio
+    sip_username: str  # Telnyx
+    sip_password: str  # Telnyx
+
+
+class ConferenceStatus(TypedDict, total=False):
+    conference_sid: str
+    status: str
+    participant_count: int
+    created_at: str
+    updated_at: str
+    events: List[Dict[str, Any]]
+
+
+class AudioPlayerResponse(TypedDict, total=False):
+    success: bool
+    conference_sid: str
+    call_sid: str
+    message: str
+
+
+class AudioReloadResponse(TypedDict, total=False):
+    success: bool
+    message: str
+    files_cached: int
+    files_failed: int
+    cache_dir: str
+    total_size_bytes: int
+
+
+class DirectWebRTCCredentials(TypedDict, total=False):
+    mode: str
+    sip_username: str
+    sip_password: str
+
+
+@dataclass(frozen=True, slots=True)
+class AudioFile:
+    """Audio file available for conference playback."""
+    id: str
+    name: str
+    display_name: str
+    duration_seconds: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AudioFile":
+        """Build from an audio-files API entry (extra fields are ignored)."""
+        return cls(
+            id=data['id'],
+            name=data['name'],
+            display_name=data.get('display_name') or data['name'],
+            duration_seconds=data.get('duration_seconds'),
+        )
+
+
+# Endpoint paths, relative to the client base_url
+_API_PREFIX = "/aicallgo/api/v1/cold-call/"
+_PATH_INITIATE = _API_PREFIX + "initiate"
+_PATH_WEBRTC_JOIN = _API_PREFIX + "webrtc-join"
+_PATH_MUTE = _API_PREFIX + "control/mute"
+_PATH_END = _API_PREFIX + "end"
+_PATH_STATUS = _API_PREFIX + "status/"
+_PATH_AUDIO_FILES = _API_PREFIX + "audio-files"
+_PATH_AUDIO_PLAYBACK = _API_PREFIX + "control/audio-playback"
+_PATH_ADD_AUDIO_PLAYER = _API_PREFIX + "add-audio-player/"
+_PATH_RELOAD_AUDIO = _API_PREFIX + "reload-audio"
+_PATH_DIRECT_CREDENTIALS = _API_PREFIX + "direct/webrtc-credentials"
+_PATH_DIRECT_START_RECORDING = _API_PREFIX + "direct/start-recording"
+_PATH_DIRECT_REGISTER_CALL = _API_PREFIX + "direct/register-call"
+_PATH_DIRECT_HANGUP = _API_PREFIX + "direct/hangup"
+# Connections per pool when HTTP/2 is on (each carries many concurrent streams)
+_HTTP2_MAX_CONNECTIONS = 4
+
+# Warm-up target; any response (even 404) leaves a pooled connection behind
+_PATH_WARM_UP = "/health"
+
+# Connection attempts retried by the transport when connecting fails. Nothing
+# has been sent at that point, so this is safe for POSTs too
+_CONNECT_RETRIES = 2
+
+# Conditional-GET entries (ETag and decoded body) kept per path
+_ETAG_CACHE_SIZE = 256
+
 
 class ColdCallAPIClient:
     """HTTP client for outcall-agent cold call API."""
 
-    def __init__(self):
-        """Initialize the API client."""
+    __slots__ = (
+        'base_url', 'api_key', 'timeout', 'max_concurrency',
+        '_headers', '_limits', '_http2', '_sem', '_sync_sem', '_client', '_sync_client',
+        '_status_inflight', '_status_inflight_sync', '_status_lock', '_etag_cache',
+    )
+
+    def __init__(
+        self,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """Initialize the API client.
+
+        Args:
+            max_connections: Upper bound on concurrent connections to outcall-agent
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection stays in the pool
+            http2: Negotiate HTTP/2 so requests multiplex over one connection
+                (default: env OUTCALL_AGENT_HTTP2, else off). Needs the h2
+                package and an https URL; plain-http URLs always use HTTP/1.1
+            max_concurrency: Cap on in-flight requests (default: env
+                OUTCALL_AGENT_MAX_CONCURRENCY, else 64)
+        """
         # Get outcall-agent URL from environment or settings
         self.base_url = os.getenv('OUTCALL_AGENT_INTERNAL_URL', 'http://outcall-agent:8000')
         self.api_key = os.getenv('INTERNAL_API_KEY', '')
@@ -22,16 +228,262 @@ class ColdCallAPIClient:
         if self.base_url.endswith('/'):
             self.base_url = self.base_url[:-1]
 
-        logger.info(f"ColdCallAPIClient initialized with base_url: {self.base_url}")
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with API key."""
-        return {
+        # Sent by default on every request of both pooled clients
+        self._headers = {
             'Content-Type': 'application/json',
             'X-API-Key': self.api_key,
         }
 
-    async def initiate_call(self, to_phone: str, from_phone: Optional[str] = None) -> Dict[str, Any]:
+        if http2 is None:
+            http2 = os.getenv('OUTCALL_AGENT_HTTP2', 'false').lower() == 'true'
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 package not installed, using HTTP/1.1 for outcall-agent")
+                http2 = False
+
+        # Cap in-flight requests so bursts queue here instead of overloading
+        # outcall-agent. Over HTTP/1.1 each request needs its own connection,
+        # so the pool is kept at least as large as the cap; HTTP/2 multiplexes
+        # requests as streams, so a few connections are enough.
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('OUTCALL_AGENT_MAX_CONCURRENCY', '64'))
+        self.max_concurrency = max_concurrency
+        if http2:
+            max_connections = min(max_connections, _HTTP2_MAX_CONNECTIONS)
+            max_keepalive_connections = min(max_keepalive_connections, _HTTP2_MAX_CONNECTIONS)
+        else:
+            max_connections = max(max_connections, max_concurrency)
+        self._sync_sem = threading.BoundedSemaphore(max_concurrency)
+
+        # In-flight get_status requests by conference SID, so concurrent
+        # pollers of the same conference share one round trip
+        self._status_inflight: Dict[str, asyncio.Future] = {}
+        self._status_inflight_sync: Dict[str, concurrent.futures.Future] = {}
+        self._status_lock = threading.Lock()
+
+        # Last ETag and decoded body per path for conditional GETs, so an
+        # unchanged resource comes back as an empty 304
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+        # One pooled client for async callers and one for the *_sync methods,
+        # so connections to outcall-agent are kept alive instead of
+        # re-handshaking per call (sync calls need no event loop at all).
+        # The async client and its semaphore are created on first async use
+        # (see _get_client), so sync-only callers never build them.
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sync_client = httpx.Client(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=self.timeout,
+            transport=httpx.HTTPTransport(
+                limits=self._limits, http2=http2,
+                socket_options=_SOCKET_OPTIONS, retries=_CONNECT_RETRIES,
+            ),
+        )
+
+        logger.info("ColdCallAPIClient initialized with base_url: %s", self.base_url)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled async client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    limits=self._limits, http2=self._http2,
+                    socket_options=_SOCKET_OPTIONS, retries=_CONNECT_RETRIES,
+                ),
+            )
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def close(self):
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._sync_client.close()
+
+    def warm_up(self) -> None:
+        """Open a pooled connection to outcall-agent before the first call.
+
+        Pays the connection (and TLS) setup up front. Failures are only logged,
+        since outcall-agent may not be reachable yet.
+        """
+        try:
+            self._sync_client.get(_PATH_WARM_UP)
+            logger.debug("Warmed up connection to %s", self.base_url)
+        except httpx.HTTPError as e:
+            logger.debug("Connection warm-up to %s failed: %s", self.base_url, e)
+
+    def close_sync(self):
+        """Close pooled connections of the sync client."""
+        self._sync_client.close()
+
+    def __enter__(self) -> "ColdCallAPIClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close_sync()
+
+    async def __aenter__(self) -> "ColdCallAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = False,
+    ) -> Any:
+        """Send a request with the pooled async client and return the JSON body.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path relative to base_url
+            json: Request body, serialized with orjson
+            params: Query string parameters
+            conditional: Send If-None-Match with the ETag of the last response
+                for this path, and reuse its body on 304 Not Modified
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        content = _dumps(json) if json is not None else None
+        headers = self._conditional_headers(path) if conditional else None
+        client = self._get_client()
+        async with self._sem:
+            response = await client.request(
+                method, path, content=content, params=params, headers=headers
+            )
+        logger.debug("%s %s -> %d", method, path, response.status_code)
+        return self._decode(path, response, conditional)
+
+    def _request_sync(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = False,
+    ) -> Any:
+        """Synchronous version of _request, using the pooled sync client."""
+        content = _dumps(json) if json is not None else None
+        headers = self._conditional_headers(path) if conditional else None
+        with self._sync_sem:
+            response = self._sync_client.request(
+                method, path, content=content, params=params, headers=headers
+            )
+        logger.debug("%s %s -> %d", method, path, response.status_code)
+        return self._decode(path, response, conditional)
+
+    def _conditional_headers(self, path: str) -> Optional[Dict[str, str]]:
+        """If-None-Match header for a path with a cached response, if any."""
+        cached = self._etag_cache.get(path)
+        return {'If-None-Match': cached[0]} if cached is not None else None
+
+    def _decode(self, path: str, response: httpx.Response, conditional: bool) -> Any:
+        """Raise on error status, else decode the body (or reuse it on 304).
+
+        For conditional requests the decoded body is cached under its ETag;
+        the cached object is returned as-is on 304, so callers must not
+        mutate it.
+        """
+        if conditional and response.status_code == 304:
+            cached = self._etag_cache.get(path)
+            if cached is not None:
+                return cached[1]
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        if conditional:
+            etag = response.headers.get('ETag')
+            if etag:
+                if path not in self._etag_cache and len(self._etag_cache) >= _ETAG_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._etag_cache.pop(next(iter(self._etag_cache)), None)
+                self._etag_cache[path] = (etag, data)
+            else:
+                self._etag_cache.pop(path, None)
+        return data
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        path: str,
+        *,
+        max_attempts: int = 3,
+        retry_on: tuple = _TRANSIENT_STATUS_CODES,
+        delay_ms: int = 100,
+        max_delay_ms: int = 1000,
+        **kwargs,
+    ) -> Any:
+        """_request, retried with backoff on transient server and network errors.
+
+        Only for idempotent requests; other errors are raised immediately.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path relative to base_url
+            max_attempts: Maximum attempts including the first (default: 3)
+            retry_on: Status codes to retry (default: 502, 503, 504)
+            delay_ms: Base delay before the first retry in milliseconds
+            max_delay_ms: Cap on the delay between retries in milliseconds
+            **kwargs: Passed through to _request
+
+        Returns:
+            Decoded JSON response
+        """
+        for attempt in range(1, max_attempts):
+            try:
+                return await self._request(method, path, **kwargs)
+            except httpx.HTTPError as e:
+                if not _is_transient(e, retry_on):
+                    raise
+                logger.warning("%s %s failed (%s), retry %d/%d", method, path, e, attempt, max_attempts - 1)
+            await asyncio.sleep(_backoff_delay(attempt, delay_ms, max_delay_ms))
+        return await self._request(method, path, **kwargs)
+
+    def _request_with_retry_sync(
+        self,
+        method: str,
+        path: str,
+        *,
+        max_attempts: int = 3,
+        retry_on: tuple = _TRANSIENT_STATUS_CODES,
+        delay_ms: int = 100,
+        max_delay_ms: int = 1000,
+        **kwargs,
+    ) -> Any:
+        """Synchronous version of _request_with_retry."""
+        for attempt in range(1, max_attempts):
+            try:
+                return self._request_sync(method, path, **kwargs)
+            except httpx.HTTPError as e:
+                if not _is_transient(e, retry_on):
+                    raise
+                logger.warning("%s %s failed (%s), retry %d/%d", method, path, e, attempt, max_attempts - 1)
+            time.sleep(_backoff_delay(attempt, delay_ms, max_delay_ms))
+        return self._request_sync(method, path, **kwargs)
+
+    async def initiate_call(self, to_phone: str, from_phone: Optional[str] = None) -> InitiateCallResponse:
         """Initiate a cold call.
 
         Args:
@@ -47,31 +499,45 @@ class ColdCallAPIClient:
         Note:
             Provider is determined by TELEPHONY_SYSTEM environment variable on the server.
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/initiate"
-
         payload = {
             'to_phone': to_phone,
+            'from_phone': from_phone or None,  # omitted when not set
         }
 
-        if from_phone:
-            payload['from_phone'] = from_phone
+        logger.debug("Initiating cold call to %s", to_phone)
 
-        logger.info(f"Initiating cold call to {to_phone}")
+        data = await self._request('POST', _PATH_INITIATE, json=payload)
+        logger.info("Cold call initiated: conference_sid=%s", data.get('conference_sid'))
+        return data
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+    async def initiate_calls(
+        self,
+        items: Sequence[Tuple[str, Optional[str]]],
+        max_concurrency: int = 16,
+    ) -> List[Union[InitiateCallResponse, Exception]]:
+        """Initiate several cold calls concurrently.
 
-            data = response.json()
-            logger.info(f"Cold call initiated: conference_sid={data.get('conference_sid')}")
-            return data
+        Args:
+            items: (to_phone, from_phone) pairs; from_phone may be None
+            max_concurrency: Calls being initiated at once (default: 16)
+
+        Returns:
+            One entry per item, in order: the initiate_call response, or the
+            exception raised for that item (other items still proceed)
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(to_phone: str, from_phone: Optional[str]) -> InitiateCallResponse:
+            async with sem:
+                return await self.initiate_call(to_phone, from_phone)
+
+        return await asyncio.gather(
+            *[_one(to_phone, from_phone) for to_phone, from_phone in items],
+            return_exceptions=True,
+        )
 
     async def join_webrtc(self, conference_id: str, client_id: str,
-                         provider: str = 'twilio', sdp_offer: Optional[str] = None) -> Dict[str, Any]:
+                         provider: str = 'twilio', sdp_offer: Optional[str] = None) -> WebRTCJoinResponse:
         """Join WebRTC participant to conference.
 
         Args:
@@ -86,30 +552,18 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/webrtc-join"
-
         payload = {
             'conference_id': conference_id,
             'client_id': client_id,
             'provider': provider,
+            'sdp_offer': sdp_offer or None,  # omitted when not set
         }
 
-        if sdp_offer:
-            payload['sdp_offer'] = sdp_offer
-
-        logger.info(f"Joining WebRTC to conference {conference_id} with provider {provider}")
+        logger.debug("Joining WebRTC to conference %s with provider %s", conference_id, provider)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"WebRTC joined: participant_sid={data.get('participant_sid')}")
-            return data
+        data = await self._request('POST', _PATH_WEBRTC_JOIN, json=payload)
+        logger.debug("WebRTC joined: participant_sid=%s", data.get('participant_sid'))
+        return data
 
     async def mute_participant(self, conference_sid: str, participant_sid: str,
                               muted: bool = True) -> Dict[str, Any]:
@@ -126,8 +580,6 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/control/mute"
-
         payload = {
             'conference_sid': conference_sid,
             'participant_sid': participant_sid,
@@ -135,19 +587,11 @@ class ColdCallAPIClient:
             'value': muted,
         }
 
-        logger.info(f"{'Muting' if muted else 'Unmuting'} participant {participant_sid}")
+        logger.debug("%s participant %s", 'Muting' if muted else 'Unmuting', participant_sid)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"Participant control successful: muted={data.get('muted')}")
-            return data
+        data = await self._request('POST', _PATH_MUTE, json=payload)
+        logger.debug("Participant control successful: muted=%s", data.get('muted'))
+        return data
 
     async def end_call(self, conference_sid: str) -> Dict[str, Any]:
         """End a conference and hang up all participants.
@@ -161,27 +605,18 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/end"
-
         payload = {
             'conference_sid': conference_sid,
         }
 
-        logger.info(f"Ending conference {conference_sid}")
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        logger.debug("Ending conference %s", conference_sid)
 
-            data = response.json()
-            logger.info(f"Conference ended: status={data.get('status')}")
-            return data
+        data = await self._request('POST', _PATH_END, json=payload)
+        self._etag_cache.pop(f"{_PATH_STATUS}{conference_sid}", None)
+        logger.info("Conference ended: status=%s", data.get('status'))
+        return data
 
-    async def get_status(self, conference_sid: str) -> Dict[str, Any]:
+    async def get_status(self, conference_sid: str) -> ConferenceStatus:
         """Get conference status.
 
         Args:
@@ -192,115 +627,161 @@ class ColdCallAPIClient:
 
         Raises:
             httpx.HTTPError: If API request fails
+
+        Note:
+            Concurrent calls for the same conference share a single request.
+            Polls are conditional GETs: when outcall-agent sends an ETag and
+            answers 304 Not Modified, the previous status is returned.
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/status/{conference_sid}"
+        future = self._status_inflight.get(conference_sid)
+        if future is not None:
+            return await asyncio.shield(future)
 
-        logger.info(f"[STATUS REQUEST] URL: {url}")
-        logger.info(f"[STATUS REQUEST] Conference SID: {conference_sid}")
-        logger.info(f"[STATUS REQUEST] Base URL: {self.base_url}")
-        logger.info(f"[STATUS REQUEST] API Key present: {bool(self.api_key)}")
+        future = asyncio.get_running_loop().create_future()
+        self._status_inflight[conference_sid] = future
+        try:
+            data = await self._fetch_status(conference_sid)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._status_inflight[conference_sid]
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers=self._get_headers(),
-                )
-                logger.info(f"[STATUS RESPONSE] Status Code: {response.status_code}")
-                response.raise_for_status()
+    async def _fetch_status(self, conference_sid: str) -> ConferenceStatus:
+        """Request conference status (see get_status)."""
+        path = f"{_PATH_STATUS}{conference_sid}"
 
-                data = response.json()
-                logger.info(f"[STATUS SUCCESS] Conference status: status={data.get('status')}, participants={data.get('participant_count')}")
-                return data
-            except httpx.HTTPError as e:
-                logger.error(f"[STATUS ERROR] HTTP Error: {e}")
-                logger.error(f"[STATUS ERROR] Response: {getattr(e, 'response', None)}")
-                raise
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[STATUS REQUEST] path=%s sid=%s base_url=%s key_present=%s",
+                path, conference_sid, self.base_url, bool(self.api_key),
+            )
 
-    def initiate_call_sync(self, to_phone: str, from_phone: Optional[str] = None) -> Dict[str, Any]:
-        """Synchronous version of initiate_call."""
-        import asyncio
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            data = await self._request_with_retry('GET', path, conditional=True)
+        except httpx.HTTPError as e:
+            logger.error("[STATUS ERROR] HTTP Error: %s", e)
+            logger.error("[STATUS ERROR] Response: %s", getattr(e, 'response', None))
+            raise
+
+        logger.debug(
+            "[STATUS SUCCESS] Conference status: status=%s, participants=%s",
+            data.get('status'), data.get('participant_count'),
+        )
+        return data
+
+    def initiate_call_sync(self, to_phone: str, from_phone: Optional[str] = None) -> InitiateCallResponse:
+        """Synchronous version of initiate_call."""
+        payload = {'to_phone': to_phone, 'from_phone': from_phone or None}
 
-        return loop.run_until_complete(self.initiate_call(to_phone, from_phone))
+        logger.debug("Initiating cold call to %s", to_phone)
+        data = self._request_sync('POST', _PATH_INITIATE, json=payload)
+        logger.info("Cold call initiated: conference_sid=%s", data.get('conference_sid'))
+        return data
 
     def join_webrtc_sync(self, conference_id: str, client_id: str,
-                        provider: str = 'twilio', sdp_offer: Optional[str] = None) -> Dict[str, Any]:
+                        provider: str = 'twilio', sdp_offer: Optional[str] = None) -> WebRTCJoinResponse:
         """Synchronous version of join_webrtc."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        payload = {
+            'conference_id': conference_id,
+            'client_id': client_id,
+            'provider': provider,
+            'sdp_offer': sdp_offer or None,
+        }
 
-        return loop.run_until_complete(self.join_webrtc(conference_id, client_id, provider, sdp_offer))
+        logger.debug("Joining WebRTC to conference %s with provider %s", conference_id, provider)
+        data = self._request_sync('POST', _PATH_WEBRTC_JOIN, json=payload)
+        logger.debug("WebRTC joined: participant_sid=%s", data.get('participant_sid'))
+        return data
 
     def mute_participant_sync(self, conference_sid: str, participant_sid: str,
                              muted: bool = True) -> Dict[str, Any]:
         """Synchronous version of mute_participant."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        payload = {
+            'conference_sid': conference_sid,
+            'participant_sid': participant_sid,
+            'action': 'mute' if muted else 'unmute',
+            'value': muted,
+        }
 
-        return loop.run_until_complete(self.mute_participant(conference_sid, participant_sid, muted))
+        logger.debug("%s participant %s", 'Muting' if muted else 'Unmuting', participant_sid)
+        data = self._request_sync('POST', _PATH_MUTE, json=payload)
+        logger.debug("Participant control successful: muted=%s", data.get('muted'))
+        return data
 
     def end_call_sync(self, conference_sid: str) -> Dict[str, Any]:
         """Synchronous version of end_call."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        logger.debug("Ending conference %s", conference_sid)
+        data = self._request_sync('POST', _PATH_END, json={'conference_sid': conference_sid})
+        self._etag_cache.pop(f"{_PATH_STATUS}{conference_sid}", None)
+        logger.info("Conference ended: status=%s", data.get('status'))
+        return data
 
-        return loop.run_until_complete(self.end_call(conference_sid))
+    def get_status_sync(self, conference_sid: str) -> ConferenceStatus:
+        """Synchronous version of get_status.
 
-    def get_status_sync(self, conference_sid: str) -> Dict[str, Any]:
-        """Synchronous version of get_status."""
-        import asyncio
+        Concurrent calls for the same conference (e.g. several sessions polling
+        it) share a single request.
+        """
+        with self._status_lock:
+            future = self._status_inflight_sync.get(conference_sid)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._status_inflight_sync[conference_sid] = future
+        if not owner:
+            return future.result()
+
+        try:
+            data = self._fetch_status_sync(conference_sid)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._status_lock:
+                del self._status_inflight_sync[conference_sid]
+
+    def _fetch_status_sync(self, conference_sid: str) -> ConferenceStatus:
+        """Synchronous version of _fetch_status."""
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            data = self._request_with_retry_sync(
+                'GET', f"{_PATH_STATUS}{conference_sid}", conditional=True
+            )
+        except httpx.HTTPError as e:
+            logger.error("[STATUS ERROR] HTTP Error: %s", e)
+            raise
 
-        return loop.run_until_complete(self.get_status(conference_sid))
+        logger.debug(
+            "[STATUS SUCCESS] Conference status: status=%s, participants=%s",
+            data.get('status'), data.get('participant_count'),
+        )
+        return data
 
     # ============================================================================
     # Audio Playback Methods (Twilio-only feature)
     # ============================================================================
 
-    async def get_audio_files(self) -> list[Dict[str, Any]]:
+    async def get_audio_files(self) -> Tuple[AudioFile, ...]:
         """Get available audio files for playback.
 
         Returns:
-            List of audio file information dicts
+            Available audio files
 
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/audio-files"
+        logger.debug("Fetching audio files")
 
-        logger.info("Fetching audio files")
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                url,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"Audio files retrieved: {len(data)} files")
-            return data
+        data = await self._request_with_retry('GET', _PATH_AUDIO_FILES)
+        logger.debug("Audio files retrieved: %d files", len(data))
+        return tuple(AudioFile.from_dict(item) for item in data)
 
     async def control_audio_playback(
         self,
@@ -321,38 +802,24 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/control/audio-playback"
-
         payload = {
             'conference_sid': conference_sid,
             'audio_id': audio_id,
             'action': action,
         }
 
-        logger.info(f"Controlling audio playback: {action} {audio_id} in {conference_sid}")
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        logger.debug("Controlling audio playback: %s %s in %s", action, audio_id, conference_sid)
 
-            data = response.json()
-            logger.info(f"Audio playback control successful: {data.get('message')}")
-            return data
+        data = await self._request('POST', _PATH_AUDIO_PLAYBACK, json=payload)
+        logger.debug("Audio playback control successful: %s", data.get('message'))
+        return data
 
-    def get_audio_files_sync(self) -> list[Dict[str, Any]]:
+    def get_audio_files_sync(self) -> Tuple[AudioFile, ...]:
         """Synchronous version of get_audio_files."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self.get_audio_files())
+        logger.debug("Fetching audio files")
+        data = self._request_with_retry_sync('GET', _PATH_AUDIO_FILES)
+        logger.debug("Audio files retrieved: %d files", len(data))
+        return tuple(AudioFile.from_dict(item) for item in data)
 
     def control_audio_playback_sync(
         self,
@@ -361,18 +828,18 @@ class ColdCallAPIClient:
         action: str,
     ) -> Dict[str, Any]:
         """Synchronous version of control_audio_playback."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        payload = {
+            'conference_sid': conference_sid,
+            'audio_id': audio_id,
+            'action': action,
+        }
 
-        return loop.run_until_complete(
-            self.control_audio_playback(conference_sid, audio_id, action)
-        )
+        logger.debug("Controlling audio playback: %s %s in %s", action, audio_id, conference_sid)
+        data = self._request_sync('POST', _PATH_AUDIO_PLAYBACK, json=payload)
+        logger.debug("Audio playback control successful: %s", data.get('message'))
+        return data
 
-    async def add_audio_player(self, conference_sid: str) -> Dict[str, Any]:
+    async def add_audio_player(self, conference_sid: str) -> AudioPlayerResponse:
         """Add audio player participant to conference.
 
         This endpoint adds a TwiML App participant that enables bidirectional
@@ -388,33 +855,20 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/add-audio-player/{conference_sid}"
-
-        logger.info(f"Adding audio player participant to conference {conference_sid}")
+        logger.debug("Adding audio player participant to conference %s", conference_sid)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        data = await self._request('POST', f"{_PATH_ADD_AUDIO_PLAYER}{conference_sid}")
+        logger.info("Audio player added: call_sid=%s", data.get('call_sid'))
+        return data
 
-            data = response.json()
-            logger.info(f"Audio player added: call_sid={data.get('call_sid')}")
-            return data
-
-    def add_audio_player_sync(self, conference_sid: str) -> Dict[str, Any]:
+    def add_audio_player_sync(self, conference_sid: str) -> AudioPlayerResponse:
         """Synchronous version of add_audio_player."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        logger.debug("Adding audio player participant to conference %s", conference_sid)
+        data = self._request_sync('POST', f"{_PATH_ADD_AUDIO_PLAYER}{conference_sid}")
+        logger.info("Audio player added: call_sid=%s", data.get('call_sid'))
+        return data
 
-        return loop.run_until_complete(self.add_audio_player(conference_sid))
-
-    async def reload_audio_from_b2(self) -> Dict[str, Any]:
+    async def reload_audio_from_b2(self) -> AudioReloadResponse:
         """Reload all audio files from B2 storage without restarting service.
 
         Returns:
@@ -423,105 +877,104 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/reload-audio"
-
-        logger.info("Reloading audio files from B2 storage")
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        logger.debug("Reloading audio files from B2 storage")
 
-            data = response.json()
-            logger.info(f"Audio reload complete: {data.get('files_cached')}/{data.get('files_cached', 0) + data.get('files_failed', 0)} files cached")
-            return data
+        data = await self._request('POST', _PATH_RELOAD_AUDIO)
+        logger.info(
+            "Audio reload complete: %s/%s files cached",
+            data.get('files_cached'), data.get('files_cached', 0) + data.get('files_failed', 0),
+        )
+        return data
 
-    def reload_audio_from_b2_sync(self) -> Dict[str, Any]:
+    def reload_audio_from_b2_sync(self) -> AudioReloadResponse:
         """Synchronous version of reload_audio_from_b2."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self.reload_audio_from_b2())
+        logger.debug("Reloading audio files from B2 storage")
+        data = self._request_sync('POST', _PATH_RELOAD_AUDIO)
+        logger.info(
+            "Audio reload complete: %s/%s files cached",
+            data.get('files_cached'), data.get('files_cached', 0) + data.get('files_failed', 0),
+        )
+        return data
 
-    def add_audio_player_with_retry_sync(
+    async def add_audio_player_with_retry(
         self,
         conference_sid: str,
         max_attempts: int = 10,
-        delay_ms: int = 500,
-    ) -> Dict[str, Any]:
+        delay_ms: int = 200,
+        max_delay_ms: int = 2000,
+        retry_server_errors: bool = False,
+    ) -> AudioPlayerResponse:
         """Add audio player participant with retry logic.
 
         Retries if conference not found (may still be initializing).
         Conference creation happens asynchronously when browser joins,
-        so we need to poll until it's ready.
+        so we need to poll until it's ready. Waits grow exponentially from
+        delay_ms up to max_delay_ms, with jitter so concurrent callers
+        don't retry in lockstep.
 
         Args:
             conference_sid: Conference SID to add audio player to
             max_attempts: Maximum retry attempts (default: 10)
-            delay_ms: Delay between retries in milliseconds (default: 500)
+            delay_ms: Base delay before the first retry in milliseconds (default: 200)
+            max_delay_ms: Cap on the delay between retries in milliseconds (default: 2000)
+            retry_server_errors: Also retry 5xx responses (default: False)
 
         Returns:
             Result dict from successful add_audio_player call
 
         Raises:
-            httpx.HTTPError: If all retries fail
+            httpx.HTTPError: If all retries fail or the error is not retryable
         """
-        import time
+        for attempt in range(1, max_attempts + 1):
+            try:
+                # Try to add audio player
+                result = await self.add_audio_player(conference_sid)
+                logger.debug("Audio player added successfully on attempt %d", attempt)
+                return result
 
-        last_error = None
+            except (httpx.HTTPStatusError, httpx.ConnectError, httpx.ReadTimeout) as e:
+                delay = _audio_player_retry_delay(
+                    e, attempt, max_attempts, delay_ms, max_delay_ms, retry_server_errors
+                )
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+
+        raise ValueError("max_attempts must be at least 1")
 
+    def add_audio_player_with_retry_sync(
+        self,
+        conference_sid: str,
+        max_attempts: int = 10,
+        delay_ms: int = 200,
+        max_delay_ms: int = 2000,
+        retry_server_errors: bool = False,
+    ) -> AudioPlayerResponse:
+        """Synchronous version of add_audio_player_with_retry."""
         for attempt in range(1, max_attempts + 1):
             try:
                 # Try to add audio player
                 result = self.add_audio_player_sync(conference_sid)
-                logger.info(f"Audio player added successfully on attempt {attempt}")
+                logger.debug("Audio player added successfully on attempt %d", attempt)
                 return result
 
-            except httpx.HTTPStatusError as e:
-                last_error = e
-
-                # Only retry on 404 (conference not found)
-                if e.response.status_code == 404:
-                    if attempt < max_attempts:
-                        logger.info(
-                            f"Conference not ready, retrying in {delay_ms}ms "
-                            f"(attempt {attempt}/{max_attempts})"
-                        )
-                        time.sleep(delay_ms / 1000.0)
-                        continue
-                    else:
-                        logger.error(
-                            f"Conference not ready after {max_attempts} attempts"
-                        )
-                else:
-                    # Other HTTP errors - don't retry
-                    logger.error(f"HTTP error {e.response.status_code}, not retrying")
+            except (httpx.HTTPStatusError, httpx.ConnectError, httpx.ReadTimeout) as e:
+                delay = _audio_player_retry_delay(
+                    e, attempt, max_attempts, delay_ms, max_delay_ms, retry_server_errors
+                )
+                if delay is None:
                     raise
 
-            except Exception as e:
-                # Network errors or other issues - retry
-                last_error = e
-                if attempt < max_attempts:
-                    logger.warning(f"Error on attempt {attempt}: {str(e)}, retrying...")
-                    time.sleep(delay_ms / 1000.0)
-                    continue
-                else:
-                    logger.error(f"Failed after {max_attempts} attempts: {str(e)}")
+            time.sleep(delay)
 
-        # All retries exhausted
-        raise last_error or Exception("Failed to add audio player after retries")
+        raise ValueError("max_attempts must be at least 1")
 
     # ============================================================================
     # Direct Calling Methods (Telnyx WebRTC Direct Mode)
     # ============================================================================
 
-    async def get_direct_webrtc_credentials(self) -> Dict[str, Any]:
+    async def get_direct_webrtc_credentials(self) -> DirectWebRTCCredentials:
         """Get SIP credentials for Telnyx WebRTC direct calling.
 
         Returns:
@@ -530,20 +983,11 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/direct/webrtc-credentials"
-
-        logger.info("Getting direct WebRTC credentials")
+        logger.debug("Getting direct WebRTC credentials")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                url,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"Direct WebRTC credentials retrieved: mode={data.get('mode')}")
-            return data
+        data = await self._request('GET', _PATH_DIRECT_CREDENTIALS)
+        logger.debug("Direct WebRTC credentials retrieved: mode=%s", data.get('mode'))
+        return data
 
     async def start_direct_recording(
         self,
@@ -564,38 +1008,24 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/direct/start-recording"
-
         payload = {
             'call_control_id': call_control_id,
             'to_phone': to_phone,
             'from_phone': from_phone,
         }
 
-        logger.info(f"Starting recording for direct call: {call_control_id}")
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        logger.debug("Starting recording for direct call: %s", call_control_id)
 
-            data = response.json()
-            logger.info(f"Direct call recording started: {call_control_id}")
-            return data
+        data = await self._request('POST', _PATH_DIRECT_START_RECORDING, json=payload)
+        logger.info("Direct call recording started: %s", call_control_id)
+        return data
 
-    def get_direct_webrtc_credentials_sync(self) -> Dict[str, Any]:
+    def get_direct_webrtc_credentials_sync(self) -> DirectWebRTCCredentials:
         """Synchronous version of get_direct_webrtc_credentials."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self.get_direct_webrtc_credentials())
+        logger.debug("Getting direct WebRTC credentials")
+        data = self._request_sync('GET', _PATH_DIRECT_CREDENTIALS)
+        logger.debug("Direct WebRTC credentials retrieved: mode=%s", data.get('mode'))
+        return data
 
     def start_direct_recording_sync(
         self,
@@ -604,16 +1034,16 @@ class ColdCallAPIClient:
         from_phone: str
     ) -> Dict[str, Any]:
         """Synchronous version of start_direct_recording."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        payload = {
+            'call_control_id': call_control_id,
+            'to_phone': to_phone,
+            'from_phone': from_phone,
+        }
 
-        return loop.run_until_complete(
-            self.start_direct_recording(call_control_id, to_phone, from_phone)
-        )
+        logger.debug("Starting recording for direct call: %s", call_control_id)
+        data = self._request_sync('POST', _PATH_DIRECT_START_RECORDING, json=payload)
+        logger.info("Direct call recording started: %s", call_control_id)
+        return data
 
     async def register_direct_call(
         self,
@@ -634,27 +1064,17 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/direct/register-call"
-
         payload = {
             'call_id': call_id,
             'to_phone': to_phone,
             'from_phone': from_phone,
         }
 
-        logger.info(f"Registering direct call: {call_id}")
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
+        logger.debug("Registering direct call: %s", call_id)
 
-            data = response.json()
-            logger.info(f"Direct call registered: {call_id}")
-            return data
+        data = await self._request('POST', _PATH_DIRECT_REGISTER_CALL, json=payload)
+        logger.info("Direct call registered: %s", call_id)
+        return data
 
     async def hangup_direct_call(self, call_id: str) -> Dict[str, Any]:
         """Hangup a Telnyx direct call.
@@ -668,23 +1088,13 @@ class ColdCallAPIClient:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/aicallgo/api/v1/cold-call/direct/hangup"
-
         payload = {'call_id': call_id}
 
-        logger.info(f"Hanging up direct call: {call_id}")
+        logger.debug("Hanging up direct call: %s", call_id)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"Direct call hangup initiated: {call_id}")
-            return data
+        data = await self._request('POST', _PATH_DIRECT_HANGUP, json=payload)
+        logger.info("Direct call hangup initiated: %s", call_id)
+        return data
 
     def register_direct_call_sync(
         self,
@@ -693,24 +1103,38 @@ class ColdCallAPIClient:
         from_phone: str
     ) -> Dict[str, Any]:
         """Synchronous version of register_direct_call."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        payload = {
+            'call_id': call_id,
+            'to_phone': to_phone,
+            'from_phone': from_phone,
+        }
 
-        return loop.run_until_complete(
-            self.register_direct_call(call_id, to_phone, from_phone)
-        )
+        logger.debug("Registering direct call: %s", call_id)
+        data = self._request_sync('POST', _PATH_DIRECT_REGISTER_CALL, json=payload)
+        logger.info("Direct call registered: %s", call_id)
+        return data
 
     def hangup_direct_call_sync(self, call_id: str) -> Dict[str, Any]:
         """Synchronous version of hangup_direct_call."""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self.hangup_direct_call(call_id))
+        logger.debug("Hanging up direct call: %s", call_id)
+        data = self._request_sync('POST', _PATH_DIRECT_HANGUP, json={'call_id': call_id})
+        logger.info("Direct call hangup initiated: %s", call_id)
+        return data
+
+
+# Global instance (lazy initialization) - shared across reruns and sessions so
+# pooled keep-alive connections survive between Streamlit script runs
+_cold_call_client = None
+
+
+def get_cold_call_client() -> ColdCallAPIClient:
+    """Get or create global cold call API client instance"""
+    global _cold_call_client
+    if _cold_call_client is None:
+        _cold_call_client = ColdCallAPIClient()
+        # Connect in the background so the first call skips the handshake
+        if os.getenv('OUTCALL_AGENT_WARM_UP', 'true').lower() == 'true':
+            threading.Thread(
+                target=_cold_call_client.warm_up, name="cold-call-warm-up", daemon=True
+            ).start()
+    return _cold_call_client
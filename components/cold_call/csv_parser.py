@@ -1,128 +1,188 @@
 """CSV parser and validator for cold call contact lists."""
 import io
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 import pandas as pd
 import streamlit as st
 
+# Contact fields read from the CSV, in output order
+CONTACT_FIELDS = ('name', 'company', 'phone', 'title')
 
-def validate_csv(uploaded_file) -> Tuple[bool, Optional[str]]:
-    """Validate CSV file format and required columns.
+# Contact table columns -> display headers
+_DISPLAY_COLUMNS = {
+    'name': 'Name',
+    'company': 'Company',
+    'phone': 'Phone',
+    'title': 'Title',
+    'status': 'Status',
+}
+
+
+class CSVValidationError(ValueError):
+    """Uploaded CSV is unreadable or lacks the required contact columns."""
+
+
+def _validate_df(df: pd.DataFrame) -> Tuple[bool, Optional[str]]:
+    """Validate an already-parsed contacts DataFrame.
 
     Args:
-        uploaded_file: Streamlit UploadedFile object
+        df: DataFrame read with dtype=str and empty cells as ''
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    try:
-        # Read CSV
-        df = pd.read_csv(uploaded_file)
+    # Check if empty
+    if df.empty:
+        return False, "CSV file is empty"
 
-        # Reset file pointer for subsequent reads
-        uploaded_file.seek(0)
+    # Required columns
+    required_columns = {'name', 'company', 'phone'}
+    missing_columns = required_columns - set(df.columns.str.lower())
 
-        # Check if empty
-        if df.empty:
-            return False, "CSV file is empty"
+    if missing_columns:
+        return False, f"Missing required columns: {', '.join(missing_columns)}"
 
-        # Required columns
-        required_columns = {'name', 'company', 'phone'}
-        missing_columns = required_columns - set(df.columns.str.lower())
+    # Check for at least one row of data
+    if len(df) == 0:
+        return False, "CSV has no contact rows"
 
-        if missing_columns:
-            return False, f"Missing required columns: {', '.join(missing_columns)}"
+    # Validate phone column is not all empty
+    phone_col = next((col for col in df.columns if col.lower() == 'phone'), None)
+    if phone_col and (df[phone_col].str.strip() == '').all():
+        return False, "Phone column has no valid numbers"
 
-        # Check for at least one row of data
-        if len(df) == 0:
-            return False, "CSV has no contact rows"
+    return True, None
 
-        # Validate phone column is not all empty
-        phone_col = next((col for col in df.columns if col.lower() == 'phone'), None)
-        if phone_col and df[phone_col].isna().all():
-            return False, "Phone column has no valid numbers"
 
-        return True, None
+def _read_csv(uploaded_file) -> pd.DataFrame:
+    """Read and validate the uploaded CSV in a single parse.
 
+    All cells are read as strings, with empty cells as '' (not NaN), so phone
+    numbers keep their formatting (including leading zeros).
+
+    Raises:
+        CSVValidationError: If the CSV cannot be parsed or is invalid
+    """
+    try:
+        uploaded_file.seek(0)
+        df = pd.read_csv(uploaded_file, dtype=str, keep_default_na=False)
     except pd.errors.EmptyDataError:
-        return False, "CSV file is empty"
+        raise CSVValidationError("CSV file is empty")
     except pd.errors.ParserError as e:
-        return False, f"CSV parsing error: {str(e)}"
+        raise CSVValidationError(f"CSV parsing error: {str(e)}")
     except Exception as e:
-        return False, f"Error validating CSV: {str(e)}"
+        raise CSVValidationError(f"Error validating CSV: {str(e)}")
+    finally:
+        # Reset file pointer for subsequent reads
+        uploaded_file.seek(0)
 
+    is_valid, error = _validate_df(df)
+    if not is_valid:
+        raise CSVValidationError(error)
+    return df
 
-def parse_contacts(uploaded_file) -> List[Dict[str, str]]:
-    """Parse CSV file and extract contact information.
+
+@st.cache_data(show_spinner=False)
+def _parse_bytes(data: bytes) -> List[Dict[str, str]]:
+    """Parse and validate CSV bytes into contacts (cached per file content).
+
+    Raises:
+        CSVValidationError: If the CSV is invalid
+        ValueError: If no valid contacts are found
+    """
+    df = _read_csv(io.BytesIO(data))
+
+    # Normalize column names to lowercase
+    df.columns = df.columns.str.lower().str.strip()
+
+    # Extract contact fields column-wise (title is optional)
+    contacts_df = pd.DataFrame(
+        {
+            col: df[col].str.strip() if col in df.columns else ''
+            for col in CONTACT_FIELDS
+        },
+        index=df.index,
+    )
+
+    # Skip rows with missing critical data
+    contacts_df = contacts_df[(contacts_df['name'] != '') & (contacts_df['phone'] != '')]
+
+    contacts = contacts_df.assign(
+        status='pending',  # Initial status
+        notes='',  # Empty notes
+        call_outcome='',  # Empty outcome
+    ).to_dict(orient='records')
+
+    if not contacts:
+        raise ValueError("No valid contacts found in CSV")
+
+    return contacts
+
+
+def validate_csv(uploaded_file) -> Tuple[bool, Optional[str]]:
+    """Validate CSV file format and required columns.
+
+    Shares the cached parse with parse_contacts, so validating and then
+    parsing the same file reads it once.
 
     Args:
         uploaded_file: Streamlit UploadedFile object
 
     Returns:
-        List of contact dictionaries with normalized column names
-
-    Raises:
-        ValueError: If CSV is invalid or parsing fails
+        Tuple of (is_valid, error_message)
     """
     try:
-        # Validate first
-        is_valid, error = validate_csv(uploaded_file)
-        if not is_valid:
-            raise ValueError(error)
-
-        # Read CSV
-        df = pd.read_csv(uploaded_file)
-
-        # Normalize column names to lowercase
-        df.columns = df.columns.str.lower().str.strip()
+        _parse_bytes(uploaded_file.getvalue())
+    except CSVValidationError as e:
+        return False, str(e)
+    except ValueError:
+        # Valid format, just no usable rows (reported by parse_contacts)
+        pass
+    return True, None
 
-        # Extract contacts
-        contacts = []
-        for idx, row in df.iterrows():
-            contact = {
-                'name': str(row.get('name', '')).strip(),
-                'company': str(row.get('company', '')).strip(),
-                'phone': str(row.get('phone', '')).strip(),
-                'title': str(row.get('title', '')).strip() if 'title' in df.columns else '',
-                'status': 'pending',  # Initial status
-                'notes': '',  # Empty notes
-                'call_outcome': '',  # Empty outcome
-            }
 
-            # Skip rows with missing critical data
-            if not contact['name'] or not contact['phone']:
-                continue
+def parse_contacts(uploaded_file) -> List[Dict[str, str]]:
+    """Parse CSV file and extract contact information.
 
-            contacts.append(contact)
+    The file is read once and the result is cached by content, so reruns
+    with the same upload skip parsing; validation runs on the parsed
+    DataFrame, so there is no need to call validate_csv first.
 
-        if not contacts:
-            raise ValueError("No valid contacts found in CSV")
+    Args:
+        uploaded_file: Streamlit UploadedFile object
 
-        return contacts
+    Returns:
+        List of contact dictionaries with normalized column names
 
+    Raises:
+        CSVValidationError: If the CSV is invalid (a ValueError)
+        ValueError: If no valid contacts are found
+    """
+    try:
+        return _parse_bytes(uploaded_file.getvalue())
+    except CSVValidationError:
+        raise
     except Exception as e:
         st.error(f"Error parsing CSV: {str(e)}")
         raise
 
 
-def display_contacts_table(contacts: List[Dict[str, str]]) -> None:
+def display_contacts_table(contacts: Union[List[Dict[str, str]], pd.DataFrame]) -> None:
     """Display contacts in a formatted table.
 
     Args:
-        contacts: List of contact dictionaries
+        contacts: List of contact dictionaries, or a DataFrame of contacts
     """
-    if not contacts:
+    if len(contacts) == 0:
         st.warning("No contacts to display")
         return
 
-    # Create DataFrame for display
-    df = pd.DataFrame(contacts)
-
-    # Select columns to display
-    display_columns = ['name', 'company', 'phone', 'title', 'status']
-    display_df = df[display_columns].copy()
-
-    # Rename columns for better display
-    display_df.columns = ['Name', 'Company', 'Phone', 'Title', 'Status']
+    # Build only the displayed columns (no intermediate full-frame copy) and
+    # rename them for better display; the table is read-only
+    if isinstance(contacts, pd.DataFrame):
+        display_df = contacts[list(_DISPLAY_COLUMNS)]
+    else:
+        display_df = pd.DataFrame(contacts, columns=list(_DISPLAY_COLUMNS))
+    display_df = display_df.rename(columns=_DISPLAY_COLUMNS, copy=False)
 
     # Display with formatting
     st.dataframe(
@@ -11,7 +11,10 @@ For complete documentation, see: docs/cold-call-dialer/odoo-integration-plan.md
 
 import os
 import ast
+import atexit
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import sys
@@ -23,6 +26,75 @@ from odoo_client import OdooClient
 
 logger = logging.getLogger(__name__)
 
+# Contacts per read when refreshing statuses of a long contact list
+_READ_CHUNK_SIZE = 100
+
+# Seconds a filter's name and domain are reused before reading them again
+_FILTER_CACHE_TTL = 60
+
+# Seconds the list of saved filters is reused (filters rarely change)
+_FILTER_LIST_CACHE_TTL = 300
+
+# Only contacts with a phone or mobile number can be dialed; prepended to
+# filter domains so Odoo drops the others instead of the dialer
+_CONTACTABLE_DOMAIN = ['|', ('phone', '!=', False), ('mobile', '!=', False)]
+
+
+def _format_boolean(value):
+    """Format boolean fields as checkmarks"""
+    if value is True:
+        return '✓'
+    elif value is False:
+        return '✗'
+    else:
+        return '-'
+
+
+def _format_number(value, default=0):
+    """Format numeric fields, treating unset (None/False) as default"""
+    if value is None or value == False:
+        return default
+    return int(value) if isinstance(value, (int, float)) else default
+
+
+def _format_contact(c: Dict, phone: str, value_to_name: Optional[Dict[str, str]]) -> Dict:
+    """Format an Odoo partner record as a dialer contact"""
+    # Get current Odoo status display name
+    current_status_value = c.get('x_cold_call_status', '')
+    current_status_name = ''
+    if current_status_value and value_to_name is not None:
+        current_status_name = value_to_name.get(current_status_value, current_status_value)
+
+    return {
+        'odoo_id': c['id'],
+        'name': c.get('name', ''),
+        'company': c.get('company_name', ''),
+        'phone': phone,
+        'title': c.get('function', ''),
+        'email': c.get('email', ''),
+        'city': c.get('city', ''),
+        'country': c.get('country_id', [None, ''])[1] if c.get('country_id') else '',
+        'status': 'pending',
+        'notes': '',
+        'call_outcome': '',
+        'current_odoo_status': current_status_name,
+        # Address fields
+        'street': c.get('street', ''),
+        'state': c.get('state_id', [None, ''])[1] if c.get('state_id') else '',
+        # Web crawled insights
+        'comment': c.get('comment', ''),
+        # Custom fields
+        'carrier_type': c.get('x_phone_carrier_type', ''),
+        'is_valid_lead': _format_boolean(c.get('x_is_valid_lead')),
+        'is_julya_icp': _format_boolean(c.get('x_is_julya_icp')),
+        'google_rating': c.get('x_google_rating', 0),
+        'google_review_count': _format_number(c.get('x_google_review_count')),
+        'outbound_ivr': _format_number(c.get('x_outbound_status_IVR')),
+        'outbound_live': _format_number(c.get('x_outbound_status_live')),
+        'outbound_no_answer': _format_number(c.get('x_outbound_status_no_answer')),
+        'outbound_voicemail': _format_number(c.get('x_outbound_status_voicemail'))
+    }
+
 
 class OdooIntegration:
     """Handles all Odoo CRM integration for cold calling"""
@@ -30,6 +102,14 @@ class OdooIntegration:
     def __init__(self):
         self.client = None
         self.status_mapping = None
+        # Runs independent Odoo RPCs concurrently so their round trips overlap
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="odoo")
+        # filter_id -> (cached_at, {'name': ..., 'domain': parsed domain list
+        # restricted to contactable partners,
+        # plus 'total' and 'total_ts' once the contacts have been counted})
+        self._filter_cache: Dict[int, Tuple[float, Dict]] = {}
+        # (cached_at, filters) from get_available_filters
+        self._filter_list_cache: Optional[Tuple[float, List[Dict]]] = None
         self._initialize_client()
         self._load_field_definitions()
 
@@ -87,6 +167,12 @@ class OdooIntegration:
             logger.error(f"Error loading field definitions: {e}")
             self.status_mapping = None
 
+    def close(self):
+        """Stop the RPC worker threads and close pooled Odoo connections"""
+        self._executor.shutdown(wait=False)
+        if self.client:
+            self.client.close()
+
     def is_available(self) -> bool:
         """Check if Odoo integration is available"""
         return self.client is not None
@@ -95,12 +181,19 @@ class OdooIntegration:
         """
         Get list of available contact filters
 
+        The list is cached for a few minutes; call invalidate_filter_cache()
+        to fetch it again.
+
         Returns:
             List of filter dictionaries with id, name, domain, context
         """
         if not self.client:
             return []
 
+        cached = self._filter_list_cache
+        if cached and time.monotonic() - cached[0] < _FILTER_LIST_CACHE_TTL:
+            return cached[1]
+
         try:
             filters = self.client.search_read(
                 'ir.filters',
@@ -112,6 +205,16 @@ class OdooIntegration:
                 order='name asc'
             )
             logger.info(f"Fetched {len(filters)} available filters")
+
+            # Prime the per-filter cache, so the first load of a listed
+            # filter skips reading its domain again
+            for filter_record in filters:
+                try:
+                    self._cache_filter(filter_record)
+                except (ValueError, SyntaxError):
+                    pass  # Unparseable domain, reported when the filter is loaded
+
+            self._filter_list_cache = (time.monotonic(), filters)
             return filters
         except Exception as e:
             logger.error(f"Error fetching filters: {e}")
@@ -121,6 +224,8 @@ class OdooIntegration:
         """
         Get total number of contacts in a filter
 
+        Only contacts with a phone or mobile number are counted. The count is cached with the filter for _FILTER_CACHE_TTL seconds.
+
         Args:
             filter_id: ID of the filter
 
@@ -131,28 +236,90 @@ class OdooIntegration:
             return 0
 
         try:
-            filter_record = self.client.read('ir.filters', [filter_id], ['domain'])[0]
-            domain = ast.literal_eval(filter_record['domain'])
-            count = self.client.search_count('res.partner', domain=domain)
+            count = self._get_filter_count(filter_id)
             logger.info(f"Filter {filter_id} contains {count} contacts")
             return count
         except Exception as e:
             logger.error(f"Error counting contacts for filter {filter_id}: {e}")
             return 0
 
+    def invalidate_filter_cache(self):
+        """Drop cached filters so the next calls read them from Odoo again"""
+        self._filter_cache.clear()
+        self._filter_list_cache = None
+
+    def _get_filter(self, filter_id: int) -> Dict:
+        """
+        Get a filter's name and parsed domain, cached for _FILTER_CACHE_TTL
+
+        Args:
+            filter_id: ID of the filter
+
+        Returns:
+            Dictionary with the filter name and its domain as a list,
+            restricted to contacts with a phone or mobile number
+        """
+        cached = self._filter_cache.get(filter_id)
+        if cached and time.monotonic() - cached[0] < _FILTER_CACHE_TTL:
+            return cached[1]
+
+        filter_record = self.client.read('ir.filters', [filter_id], ['domain', 'name'])[0]
+        return self._cache_filter(filter_record)
+
+    def _get_filter_count(self, filter_id: int, force_refresh: bool = False) -> int:
+        """
+        Count contacts matching a filter, cached alongside the filter
+
+        Args:
+            filter_id: ID of the filter
+            force_refresh: Count again even if a cached count is available
+
+        Returns:
+            Total count of contacts matching the filter
+        """
+        filter_entry = self._get_filter(filter_id)
+        if (
+            not force_refresh
+            and 'total' in filter_entry
+            and time.monotonic() - filter_entry['total_ts'] < _FILTER_CACHE_TTL
+        ):
+            return filter_entry['total']
+
+        total = self.client.search_count('res.partner', domain=filter_entry['domain'])
+        filter_entry['total'] = total
+        filter_entry['total_ts'] = time.monotonic()
+        return total
+
+    def _cache_filter(self, filter_record: Dict) -> Dict:
+        """Parse an ir.filters record's domain once and cache it by filter id"""
+        entry = {
+            'name': filter_record['name'],
+            'domain': _CONTACTABLE_DOMAIN + list(ast.literal_eval(filter_record['domain'])),
+        }
+        self._filter_cache[filter_record['id']] = (time.monotonic(), entry)
+        return entry
+
     def load_contacts_from_filter(
         self,
         filter_id: int,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        force_refresh: bool = False
     ) -> Dict:
         """
         Load contacts from filter with pagination
 
+        Only contacts with a phone or mobile number are loaded and counted,
+        so every page is full of dialable contacts.
+        The total count is cached with the filter, so paging through a
+        filter does not count its contacts again on every page.
+
         Args:
             filter_id: ID of the filter to load contacts from
             page: Page number (1-indexed)
             page_size: Number of contacts per page
+            force_refresh: Count the filter's contacts again instead of
+                using a cached total
 
         Returns:
             Dictionary with contacts, pagination info, and filter name
@@ -170,17 +337,16 @@ class OdooIntegration:
 
         try:
             # Get filter domain and name
-            filter_record = self.client.read('ir.filters', [filter_id], ['domain', 'name'])[0]
-            domain = ast.literal_eval(filter_record['domain'])
-
-            # Get total count
-            total = self.client.search_count('res.partner', domain=domain)
+            filter_record = self._get_filter(filter_id)
+            domain = filter_record['domain']
 
-            # Calculate pagination
-            offset = (page - 1) * page_size
-            total_pages = math.ceil(total / page_size) if total > 0 else 0
+            # Get total count (unless cached) while the page loads
+            total_future = self._executor.submit(
+                self._get_filter_count, filter_id, force_refresh
+            )
 
             # Load contacts
+            offset = (page - 1) * page_size
             contacts = self.client.search_read(
                 'res.partner',
                 domain=domain,
@@ -201,68 +367,19 @@ class OdooIntegration:
                 order='name asc'
             )
 
+            # Calculate pagination
+            total = total_future.result()
+            total_pages = math.ceil(total / page_size) if total > 0 else 0
+
             # Format for admin-board
-            formatted_contacts = []
-            for c in contacts:
-                # Prefer mobile over phone
-                phone = c.get('mobile') or c.get('phone') or ''
-
-                # Skip contacts without phone
-                if not phone:
-                    continue
-
-                # Get current Odoo status display name
-                current_status_value = c.get('x_cold_call_status', '')
-                current_status_name = ''
-                if current_status_value and self.status_mapping:
-                    current_status_name = self.status_mapping['value_to_name'].get(
-                        current_status_value, current_status_value
-                    )
-
-                # Format boolean fields as checkmarks
-                def format_boolean(value):
-                    if value is True:
-                        return '✓'
-                    elif value is False:
-                        return '✗'
-                    else:
-                        return '-'
-
-                # Format numeric fields
-                def format_number(value, default=0):
-                    if value is None or value == False:
-                        return default
-                    return int(value) if isinstance(value, (int, float)) else default
-
-                formatted_contacts.append({
-                    'odoo_id': c['id'],
-                    'name': c.get('name', ''),
-                    'company': c.get('company_name', ''),
-                    'phone': phone,
-                    'title': c.get('function', ''),
-                    'email': c.get('email', ''),
-                    'city': c.get('city', ''),
-                    'country': c.get('country_id', [None, ''])[1] if c.get('country_id') else '',
-                    'status': 'pending',
-                    'notes': '',
-                    'call_outcome': '',
-                    'current_odoo_status': current_status_name,
-                    # Address fields
-                    'street': c.get('street', ''),
-                    'state': c.get('state_id', [None, ''])[1] if c.get('state_id') else '',
-                    # Web crawled insights
-                    'comment': c.get('comment', ''),
-                    # Custom fields
-                    'carrier_type': c.get('x_phone_carrier_type', ''),
-                    'is_valid_lead': format_boolean(c.get('x_is_valid_lead')),
-                    'is_julya_icp': format_boolean(c.get('x_is_julya_icp')),
-                    'google_rating': c.get('x_google_rating', 0),
-                    'google_review_count': format_number(c.get('x_google_review_count')),
-                    'outbound_ivr': format_number(c.get('x_outbound_status_IVR')),
-                    'outbound_live': format_number(c.get('x_outbound_status_live')),
-                    'outbound_no_answer': format_number(c.get('x_outbound_status_no_answer')),
-                    'outbound_voicemail': format_number(c.get('x_outbound_status_voicemail'))
-                })
+            value_to_name = self.status_mapping['value_to_name'] if self.status_mapping else None
+            formatted_contacts = [
+                _format_contact(c, phone, value_to_name)
+                for c in contacts
+                # Prefer mobile over phone; skip contacts whose phone is
+                # blank (not unset, so the domain let them through)
+                if (phone := c.get('mobile') or c.get('phone'))
+            ]
 
             logger.info(
                 f"Loaded {len(formatted_contacts)} contacts from filter '{filter_record['name']}' "
@@ -449,14 +566,19 @@ class OdooIntegration:
             # Convert status name to value
             status_value = self.status_name_to_value(status_name)
 
-            # Update status field
+            # Update status field (in the background; independent of the note)
+            status_future = None
             if status_value:
-                result['status_updated'] = self.update_contact_status(odoo_id, status_value)
+                status_future = self._executor.submit(
+                    self.update_contact_status, odoo_id, status_value
+                )
             else:
                 logger.warning(f"Could not map status name '{status_name}' to Odoo value")
 
             # Create activity note
             result['note_created'] = self.create_call_note(odoo_id, status_name, duration, notes)
+            if status_future is not None:
+                result['status_updated'] = status_future.result()
 
             # Overall success if at least one operation succeeded
             result['success'] = result['status_updated'] or result['note_created']
@@ -489,11 +611,17 @@ class OdooIntegration:
             return {}
 
         try:
-            contacts = self.client.read(
-                'res.partner',
-                odoo_ids,
-                ['id', 'x_cold_call_status']
-            )
+            # Read in chunks on the worker pool, whose size caps concurrent
+            # requests to Odoo
+            chunks = [
+                odoo_ids[i:i + _READ_CHUNK_SIZE]
+                for i in range(0, len(odoo_ids), _READ_CHUNK_SIZE)
+            ]
+            contacts = [
+                contact
+                for chunk_contacts in self._executor.map(self._read_statuses, chunks)
+                for contact in chunk_contacts
+            ]
 
             status_map = {}
             for contact in contacts:
@@ -508,6 +636,14 @@ class OdooIntegration:
             logger.error(f"Error refreshing contact statuses: {e}")
             return {}
 
+    def _read_statuses(self, odoo_ids: List[int]) -> List[Dict]:
+        """Read the cold call status field of the given contacts"""
+        return self.client.read(
+            'res.partner',
+            odoo_ids,
+            ['id', 'x_cold_call_status']
+        )
+
 
 # Singleton instance
 _odoo_integration = None
@@ -523,4 +659,5 @@ def get_odoo_integration() -> OdooIntegration:
     global _odoo_integration
     if _odoo_integration is None:
         _odoo_integration = OdooIntegration()
+        atexit.register(_odoo_integration.close)
     return _odoo_integration
@@ -1,47 +1,91 @@
 """Phone number validation and E.164 formatting utilities."""
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Tuple, Optional, Union
 import phonenumbers
-from phonenumbers import NumberParseException
+from phonenumbers import NumberParseException, PhoneNumber
 
 
-def validate_phone(phone: str, default_region: str = 'US') -> Tuple[bool, Optional[str]]:
-    """Validate a phone number.
+@lru_cache(maxsize=4096)
+def _parse_cached(phone: str, default_region: Optional[str]) -> Union[PhoneNumber, Tuple[int, str]]:
+    """Parse a phone number, returning parse errors as (error_type, message).
 
-    Args:
-        phone: Phone number string to validate
-        default_region: Default country code for parsing (default: US)
+    Cached per (phone, default_region), so numbers seen again (re-validated
+    contacts, reruns) skip phonenumbers' regex-heavy parsing. Errors are
+    cached as plain data rather than the exception, since re-raising one
+    shared instance would keep growing its traceback with caller frames.
+    """
+    try:
+        return phonenumbers.parse(phone, default_region)
+    except NumberParseException as e:
+        return e.error_type, e._msg
+
+
+def _parse(phone: str, default_region: str) -> PhoneNumber:
+    """Cached phonenumbers.parse; raises the same errors.
+
+    The returned PhoneNumber is shared between callers and must not be
+    modified.
+    """
+    phone = phone.strip()
+    # A leading '+' carries the country code, so the default region plays no
+    # part; dropping it lets such numbers share one cache entry per number
+    result = _parse_cached(phone, None if phone.startswith('+') else default_region)
+    if isinstance(result, tuple):
+        raise NumberParseException(*result)
+    return result
+
+
+# NumberParseException error types -> user-facing messages
+_PARSE_ERROR_MESSAGES = {
+    NumberParseException.INVALID_COUNTRY_CODE: "Invalid country code",
+    NumberParseException.NOT_A_NUMBER: "Not a valid phone number",
+    NumberParseException.TOO_SHORT_NSN: "Phone number too short",
+    NumberParseException.TOO_SHORT_AFTER_IDD: "Phone number too short",
+    NumberParseException.TOO_LONG: "Phone number too long",
+}
+
+
+def _parse_valid(phone: str, default_region: str) -> Tuple[Optional[PhoneNumber], Optional[str]]:
+    """Parse and validate a phone number in a single pass.
 
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (parsed_number, error_message); parsed_number is None
+        when the phone number is invalid
     """
     if not phone or not phone.strip():
-        return False, "Phone number is empty"
+        return None, "Phone number is empty"
 
     try:
-        # Parse the phone number
-        parsed = phonenumbers.parse(phone, default_region)
+        parsed = _parse(phone, default_region)
 
         # Check if valid
         if not phonenumbers.is_valid_number(parsed):
-            return False, "Invalid phone number format"
+            return None, "Invalid phone number format"
 
         # Check if it's a possible number for the region
         if not phonenumbers.is_possible_number(parsed):
-            return False, "Phone number is not possible for this region"
+            return None, "Phone number is not possible for this region"
 
-        return True, None
+        return parsed, None
 
     except NumberParseException as e:
-        error_messages = {
-            NumberParseException.INVALID_COUNTRY_CODE: "Invalid country code",
-            NumberParseException.NOT_A_NUMBER: "Not a valid phone number",
-            NumberParseException.TOO_SHORT_NSN: "Phone number too short",
-            NumberParseException.TOO_SHORT_AFTER_IDD: "Phone number too short",
-            NumberParseException.TOO_LONG: "Phone number too long",
-        }
-        return False, error_messages.get(e.error_type, f"Invalid phone number: {str(e)}")
+        return None, _PARSE_ERROR_MESSAGES.get(e.error_type, f"Invalid phone number: {str(e)}")
     except Exception as e:
-        return False, f"Error validating phone: {str(e)}"
+        return None, f"Error validating phone: {str(e)}"
+
+
+def validate_phone(phone: str, default_region: str = 'US') -> Tuple[bool, Optional[str]]:
+    """Validate a phone number.
+
+    Args:
+        phone: Phone number string to validate
+        default_region: Default country code for parsing (default: US)
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    parsed, error = _parse_valid(phone, default_region)
+    return parsed is not None, error
 
 
 def format_e164(phone: str, default_region: str = 'US') -> Optional[str]:
@@ -54,21 +98,10 @@ def format_e164(phone: str, default_region: str = 'US') -> Optional[str]:
     Returns:
         E.164 formatted phone number or None if invalid
     """
-    try:
-        # Parse the phone number
-        parsed = phonenumbers.parse(phone, default_region)
-
-        # Validate before formatting
-        if not phonenumbers.is_valid_number(parsed):
-            return None
-
-        # Format to E.164
-        return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-
-    except NumberParseException:
-        return None
-    except Exception:
+    parsed, _ = _parse_valid(phone, default_region)
+    if parsed is None:
         return None
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
 
 
 def format_international(phone: str, default_region: str = 'US') -> Optional[str]:
@@ -82,7 +115,7 @@ def format_international(phone: str, default_region: str = 'US') -> Optional[str
         International formatted phone number or None if invalid
     """
     try:
-        parsed = phonenumbers.parse(phone, default_region)
+        parsed = _parse(phone, default_region)
 
         if not phonenumbers.is_valid_number(parsed):
             return None
@@ -106,7 +139,7 @@ def format_national(phone: str, default_region: str = 'US') -> Optional[str]:
         National formatted phone number or None if invalid
     """
     try:
-        parsed = phonenumbers.parse(phone, default_region)
+        parsed = _parse(phone, default_region)
 
         if not phonenumbers.is_valid_number(parsed):
             return None
@@ -130,7 +163,7 @@ def get_country_code(phone: str, default_region: str = 'US') -> Optional[str]:
         Country code (e.g., 'US', 'GB') or None if invalid
     """
     try:
-        parsed = phonenumbers.parse(phone, default_region)
+        parsed = _parse(phone, default_region)
 
         if not phonenumbers.is_valid_number(parsed):
             return None
@@ -153,14 +186,9 @@ def validate_and_format(phone: str, default_region: str = 'US') -> Tuple[bool, O
     Returns:
         Tuple of (is_valid, formatted_e164, error_message)
     """
-    is_valid, error = validate_phone(phone, default_region)
+    parsed, error = _parse_valid(phone, default_region)
 
-    if not is_valid:
+    if parsed is None:
         return False, None, error
 
-    formatted = format_e164(phone, default_region)
-
-    if not formatted:
-        return False, None, "Failed to format phone number"
-
-    return True, formatted, None
+    return True, phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164), None
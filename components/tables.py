@@ -2,6 +2,7 @@
 Table components for data display with enhanced functionality.
 """
 import streamlit as st
+import numpy as np
 import pandas as pd
 from typing import Optional, List, Dict, Any
 
@@ -171,20 +172,23 @@ def filterable_table(
             filter_columns={"plan": ["all", "trial", "professional"]}
         )
     """
-    filtered_df = df.copy()
+    # Rows kept by the search and the dropdown filters; the DataFrame is
+    # sliced once at the end instead of copied and re-filtered per step
+    mask = np.ones(len(df), dtype=bool)
 
     # Search bar
     search_query = st.text_input("🔍 Search", placeholder="Search...")
 
     if search_query:
-        # Search across specified columns
-        mask = pd.Series([False] * len(filtered_df))
+        # Search across specified columns: plain substring match (the query
+        # is not a regex), OR-ed into a single boolean array
+        search_mask = np.zeros(len(df), dtype=bool)
         for col in searchable_columns:
-            if col in filtered_df.columns:
-                mask |= filtered_df[col].astype(str).str.contains(
-                    search_query, case=False, na=False
-                )
-        filtered_df = filtered_df[mask]
+            if col in df.columns:
+                search_mask |= df[col].astype(str).str.contains(
+                    search_query, case=False, na=False, regex=False
+                ).to_numpy()
+        mask &= search_mask
 
     # Filter dropdowns
     if filter_columns:
@@ -198,9 +202,11 @@ def filterable_table(
                 )
 
                 if selected and selected.lower() != "all":
-                    filtered_df = filtered_df[
-                        filtered_df[col_name].astype(str).str.lower() == selected.lower()
-                    ]
+                    mask &= (
+                        df[col_name].astype(str).str.lower() == selected.lower()
+                    ).to_numpy()
+
+    filtered_df = df[mask]
 
     # Display filtered table
     render_dataframe(filtered_df)
@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy import text
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from config.settings import settings
 import logging
 
@@ -110,3 +111,22 @@ def get_db_info() -> dict:
     except Exception as e:
         logger.error(f"Failed to get database info: {e}")
         return {}
+
+
+def check_db_health_and_info() -> tuple[bool, str, dict]:
+    """
+    Run the health check and statistics queries concurrently.
+
+    Both are independent reads, so they run on two pooled connections at the
+    same time instead of one after the other.
+
+    Returns:
+        tuple: (is_healthy: bool, message: str, info: dict) - info is empty when unhealthy
+    """
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="db-health") as executor:
+        health_future = executor.submit(check_db_health)
+        info_future = executor.submit(get_db_info)
+        is_healthy, message = health_future.result()
+        info = info_future.result()
+
+    return is_healthy, message, info if is_healthy else {}
@@ -5,6 +5,8 @@ import logging
 from typing import Dict, List, Optional, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 logger = logging.getLogger(__name__)
@@ -31,7 +33,15 @@ class OdooClient:
         ... )
     """
 
-    def __init__(self, url: str, db: str, username: str, password: str, timeout: int = 120):
+    def __init__(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        password: str,
+        timeout: int = 120,
+        pool_maxsize: int = 20
+    ):
         """Initialize Odoo client.
 
         Args:
@@ -40,6 +50,7 @@ class OdooClient:
             username: Odoo username
             password: Odoo password
             timeout: Request timeout in seconds (default: 120)
+            pool_maxsize: Connections kept open to Odoo for concurrent calls (default: 20)
         """
         self.url = url.rstrip('/')
         self.db = db
@@ -49,6 +60,19 @@ class OdooClient:
         self.uid: Optional[int] = None
         self.jsonrpc_url = f"{self.url}/jsonrpc"
 
+        # Pooled session so calls reuse kept-alive TCP/TLS connections instead
+        # of reconnecting per call. Retry only covers failed connection
+        # attempts: POST is not retried once the request was sent.
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _call_jsonrpc(self, service: str, method: str, *args) -> Any:
         """Make a JSON-RPC call to Odoo.
 
@@ -77,11 +101,10 @@ class OdooClient:
 
         logger.debug(f"JSON-RPC call: {service}.{method}")
 
-        response = requests.post(
+        response = self.session.post(
             self.jsonrpc_url,
             json=payload,
-            timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
+            timeout=self.timeout
         )
 
         response.raise_for_status()
@@ -95,6 +118,10 @@ class OdooClient:
 
         return result.get("result")
 
+    def close(self) -> None:
+        """Close pooled connections to Odoo."""
+        self.session.close()
+
     def authenticate(self) -> int:
         """Authenticate with Odoo and get UID.
 
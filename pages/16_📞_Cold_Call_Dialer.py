@@ -21,13 +21,13 @@ PROVIDER = settings.COLD_CALL_PROVIDER.lower()  # 'twilio' or 'telnyx'
 
 # Import cold call components
 from components.cold_call.csv_parser import (
-    validate_csv,
+    CSVValidationError,
     parse_contacts,
     update_contact_status,
     get_contact_by_index,
 )
 from components.cold_call.phone_validator import validate_and_format
-from components.cold_call.api_client import ColdCallAPIClient
+from components.cold_call.api_client import get_cold_call_client
 
 # Import Odoo integration
 from components.cold_call.odoo_integration import get_odoo_integration
@@ -98,7 +98,7 @@ if 'audio_setup_attempt' not in st.session_state:
     st.session_state.audio_setup_attempt = 0
 
 # Initialize API client
-api_client = ColdCallAPIClient()
+api_client = get_cold_call_client()
 
 # Initialize Odoo integration
 odoo = get_odoo_integration()
@@ -718,6 +718,7 @@ if not st.session_state.contacts:
             with col1:
                 if st.button("🔄 Refresh Filters", use_container_width=True):
                     with st.spinner("Fetching filters from Odoo..."):
+                        odoo.invalidate_filter_cache()
                         st.session_state.odoo_filters = odoo.get_available_filters()
                     if st.session_state.odoo_filters:
                         st.success(f"Found {len(st.session_state.odoo_filters)} filters")
@@ -756,7 +757,10 @@ if not st.session_state.contacts:
                         with st.spinner(f"Loading contacts from '{selected_filter_name}'..."):
                             # Always load page 1 with default page size (reduced from 50 to 20 for better performance)
                             default_page_size = 20
-                            result = odoo.load_contacts_from_filter(filter_id, page=1, page_size=default_page_size)
+                            # Recount on an explicit load so the total is never a cached, stale one
+                            result = odoo.load_contacts_from_filter(
+                                filter_id, page=1, page_size=default_page_size, force_refresh=True
+                            )
 
                             if 'error' in result:
                                 st.error(f"❌ Error: {result['error']}")
@@ -812,28 +816,26 @@ if not st.session_state.contacts:
             st.markdown("- `title` - Job title (optional)")
 
         if uploaded_file is not None:
-            with st.spinner("Validating CSV..."):
-                is_valid, error = validate_csv(uploaded_file)
-
-            if is_valid:
-                st.success("✅ CSV validation passed")
-
-                try:
+            # Single read: parse_contacts validates the parsed CSV itself
+            try:
+                with st.spinner("Validating CSV..."):
                     contacts = parse_contacts(uploaded_file)
-                    st.session_state.contacts = contacts
-                    st.session_state.odoo_pagination = {
-                        'page': 1,
-                        'page_size': len(contacts),
-                        'total': len(contacts),
-                        'total_pages': 1,
-                        'filter_name': 'CSV Upload'
-                    }
-                    st.success(f"✅ Loaded {len(contacts)} contacts")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Error parsing CSV: {str(e)}")
+            except CSVValidationError as e:
+                st.error(f"❌ CSV validation failed: {str(e)}")
+            except Exception as e:
+                st.error(f"❌ Error parsing CSV: {str(e)}")
             else:
-                st.error(f"❌ CSV validation failed: {error}")
+                st.success("✅ CSV validation passed")
+                st.session_state.contacts = contacts
+                st.session_state.odoo_pagination = {
+                    'page': 1,
+                    'page_size': len(contacts),
+                    'total': len(contacts),
+                    'total_pages': 1,
+                    'filter_name': 'CSV Upload'
+                }
+                st.success(f"✅ Loaded {len(contacts)} contacts")
+                st.rerun()
 
         # Example CSV format
         with st.expander("📋 Example CSV Format"):
@@ -1279,7 +1281,7 @@ else:
                             api_client.add_audio_player_with_retry_sync(
                                 conference_sid=st.session_state.current_call['conference_sid'],
                                 max_attempts=10,  # 10 attempts
-                                delay_ms=500,     # 500ms between attempts (max 5 seconds total)
+                                delay_ms=200,     # backoff from 200ms, doubling up to 2s
                             )
                             st.session_state.audio_player_ready = True
                             st.session_state.audio_setup_attempt = 0
@@ -1419,14 +1421,14 @@ else:
 
                                     with cols[col_idx]:
                                         # Determine button state
-                                        is_playing = (st.session_state.playing_audio_id == audio_file['id'])
+                                        is_playing = (st.session_state.playing_audio_id == audio_file.id)
 
                                         if is_playing:
-                                            btn_label = f"⏹️ Stop {audio_file['display_name']}"
+                                            btn_label = f"⏹️ Stop {audio_file.display_name}"
                                             btn_type = "secondary"
                                             btn_disabled = False
                                         else:
-                                            btn_label = f"▶️ {audio_file['display_name']}"
+                                            btn_label = f"▶️ {audio_file.display_name}"
                                             btn_type = "primary"
                                             # Disable if another audio is playing
                                             btn_disabled = (st.session_state.playing_audio_id is not None)
@@ -1436,28 +1438,28 @@ else:
                                             use_container_width=True,
                                             type=btn_type,
                                             disabled=btn_disabled,
-                                            key=f"audio_{audio_file['id']}_btn",
-                                            help=f"{audio_file['name']} ({audio_file['duration_seconds']}s)",
+                                            key=f"audio_{audio_file.id}_btn",
+                                            help=f"{audio_file.name} ({audio_file.duration_seconds}s)",
                                         ):
                                             try:
                                                 if is_playing:
                                                     # Stop audio
                                                     api_client.control_audio_playback_sync(
                                                         conference_sid=st.session_state.current_call['conference_sid'],
-                                                        audio_id=audio_file['id'],
+                                                        audio_id=audio_file.id,
                                                         action='stop',
                                                     )
                                                     st.session_state.playing_audio_id = None
-                                                    st.success(f"Stopped {audio_file['name']}")
+                                                    st.success(f"Stopped {audio_file.name}")
                                                 else:
                                                     # Play audio
                                                     api_client.control_audio_playback_sync(
                                                         conference_sid=st.session_state.current_call['conference_sid'],
-                                                        audio_id=audio_file['id'],
+                                                        audio_id=audio_file.id,
                                                         action='play',
                                                     )
-                                                    st.session_state.playing_audio_id = audio_file['id']
-                                                    st.success(f"Playing {audio_file['name']}")
+                                                    st.session_state.playing_audio_id = audio_file.id
+                                                    st.success(f"Playing {audio_file.name}")
 
                                                 st.rerun()
 
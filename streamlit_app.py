@@ -2,10 +2,11 @@
 AICallGO Admin Board - Main Application
 Entry point for Streamlit admin dashboard with persistent sidebar
 """
+import os
 import streamlit as st
 from config.settings import settings
 from config.auth import require_auth, login_form, logout
-from database.connection import check_db_health, get_db_info, get_session
+from database.connection import check_db_health_and_info, get_session
 from services.system_service import generate_system_report
 
 # ====================
@@ -24,8 +25,20 @@ st.set_page_config(
 # ====================
 # Load Custom CSS
 # ====================
-with open("static/custom.css") as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+CSS_PATH = "static/custom.css"
+
+
+@st.cache_resource
+def _load_css(path: str, mtime: float) -> str:
+    """Read stylesheet once per process (mtime in the key picks up edits)"""
+    with open(path) as f:
+        return f.read()
+
+
+st.markdown(
+    f"<style>{_load_css(CSS_PATH, os.path.getmtime(CSS_PATH))}</style>",
+    unsafe_allow_html=True
+)
 
 # ====================
 # Authentication Gate
@@ -37,6 +50,20 @@ if not require_auth():
 # ====================
 # Define Home Page Content
 # ====================
+@st.cache_resource
+def safe_db_url() -> str:
+    """Database URL with credentials hidden (computed once per process)
+
+    st.cache_resource rather than functools.lru_cache: Streamlit re-executes
+    this script on every rerun, which would redefine the function and start
+    an empty lru_cache each time.
+    """
+    db_parts = str(settings.DATABASE_URL_SYNC).split('@')
+    if len(db_parts) > 1:
+        return f"...@{db_parts[1]}"
+    return "Connected"
+
+
 def home_page():
     """Home page - System status and operations overview"""
     st.title("📊 AICallGO Admin Dashboard")
@@ -208,57 +235,67 @@ def home_page():
             st.write("**Session Timeout:**", f"{settings.SESSION_TIMEOUT_HOURS} hours")
 
         with col2:
-            # Hide credentials from database URL
-            db_url = str(settings.DATABASE_URL_SYNC)
-            db_parts = db_url.split('@')
-            if len(db_parts) > 1:
-                db_display = f"...@{db_parts[1]}"
-            else:
-                db_display = "Connected"
-            st.write("**Database:**", db_display)
+            st.write("**Database:**", safe_db_url())
             st.write("**Streamlit Version:**", st.__version__)
             st.write("**Python Version:**", "3.12+")
 
 # ====================
 # Define Page Navigation
 # ====================
-pages = {
-    "app": [
-        st.Page(home_page, title="Home", icon="🏠"),
-    ],
-    "Dashboard": [
-        st.Page("pages/1_📊_Dashboard.py", title="Dashboard", icon="📊"),
-        st.Page("pages/2_👥_Users.py", title="Users", icon="👥"),
-        st.Page("pages/3_🏢_Businesses.py", title="Businesses", icon="🏢"),
-        st.Page("pages/4_🤖_Agents.py", title="Agents", icon="🤖"),
-        st.Page("pages/15_📝_Edit_Industry_Knowledge.py", title="Edit Industry Knowledge", icon="📝"),
-        st.Page("pages/5_📞_Call_Logs.py", title="Call Logs", icon="📞"),
-        st.Page("pages/9_📅_Appointments.py", title="Appointments", icon="📅"),
-    ],
-    "Telephony": [
-        st.Page("pages/12_📞_Twilio.py", title="Twilio Pool", icon="📞"),
-        st.Page("pages/14_🔍_Call_Forward_Research.py", title="Call Forward Research", icon="🔍"),
-    ],
-    "Outbound": [
-        st.Page("pages/16_📞_Cold_Call_Dialer.py", title="Cold Call Dialer", icon="📞"),
-    ],
-    "Billing": [
-        st.Page("pages/6_💳_Billing.py", title="Billing", icon="💳"),
-        st.Page("pages/6_⚡_Entitlements.py", title="Entitlements", icon="⚡"),
-        st.Page("pages/7_💰_Credits.py", title="Credits", icon="💰"),
-        st.Page("pages/8_🎟️_Promotions.py", title="Promotions", icon="🎟️"),
-    ],
-    "System": [
-        st.Page("pages/10_🔧_System.py", title="System", icon="🔧"),
-        st.Page("pages/11_📋_Logs.py", title="Logs", icon="📋"),
-        st.Page("pages/13_📊_Performance.py", title="Performance", icon="📊"),
-    ],
-}
+def build_pages() -> dict:
+    """Build the navigation page map"""
+    return {
+        "app": [
+            st.Page(home_page, title="Home", icon="🏠"),
+        ],
+        "Dashboard": [
+            st.Page("pages/1_📊_Dashboard.py", title="Dashboard", icon="📊"),
+            st.Page("pages/2_👥_Users.py", title="Users", icon="👥"),
+            st.Page("pages/3_🏢_Businesses.py", title="Businesses", icon="🏢"),
+            st.Page("pages/4_🤖_Agents.py", title="Agents", icon="🤖"),
+            st.Page("pages/15_📝_Edit_Industry_Knowledge.py", title="Edit Industry Knowledge", icon="📝"),
+            st.Page("pages/5_📞_Call_Logs.py", title="Call Logs", icon="📞"),
+            st.Page("pages/9_📅_Appointments.py", title="Appointments", icon="📅"),
+        ],
+        "Telephony": [
+            st.Page("pages/12_📞_Twilio.py", title="Twilio Pool", icon="📞"),
+            st.Page("pages/14_🔍_Call_Forward_Research.py", title="Call Forward Research", icon="🔍"),
+        ],
+        "Outbound": [
+            st.Page("pages/16_📞_Cold_Call_Dialer.py", title="Cold Call Dialer", icon="📞"),
+        ],
+        "Billing": [
+            st.Page("pages/6_💳_Billing.py", title="Billing", icon="💳"),
+            st.Page("pages/6_⚡_Entitlements.py", title="Entitlements", icon="⚡"),
+            st.Page("pages/7_💰_Credits.py", title="Credits", icon="💰"),
+            st.Page("pages/8_🎟️_Promotions.py", title="Promotions", icon="🎟️"),
+        ],
+        "System": [
+            st.Page("pages/10_🔧_System.py", title="System", icon="🔧"),
+            st.Page("pages/11_📋_Logs.py", title="Logs", icon="📋"),
+            st.Page("pages/13_📊_Performance.py", title="Performance", icon="📊"),
+        ],
+    }
+
+
+# st.Page objects carry per-run navigation state, so they are built once per
+# session (not shared process-wide) and reused on every rerun
+if "nav_pages" not in st.session_state:
+    st.session_state.nav_pages = build_pages()
+pages = st.session_state.nav_pages
 
 # ====================
 # Persistent Sidebar
 # ====================
-with st.sidebar:
+@st.cache_data(ttl=30)
+def load_db_status():
+    """Load database health and statistics with caching"""
+    return check_db_health_and_info()
+
+
+@st.fragment
+def render_sidebar():
+    """Sidebar body - runs as a fragment so its buttons rerun only the sidebar"""
     # Header
     st.header("📊 Admin Board")
     st.write(f"👤 **{st.session_state.username}**")
@@ -269,21 +306,22 @@ with st.sidebar:
     st.markdown("### System Health")
     if st.button("Check Database", use_container_width=True):
         with st.spinner("Checking connection..."):
-            is_healthy, message = check_db_health()
+            is_healthy, message, db_info = load_db_status()
             if is_healthy:
                 st.success(message)
 
                 # Show database stats
                 with st.expander("Database Statistics"):
-                    db_info = get_db_info()
                     if db_info:
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.metric("Users", db_info.get('users', 0))
-                            st.metric("Businesses", db_info.get('businesses', 0))
-                        with col2:
-                            st.metric("Call Logs", db_info.get('call_logs', 0))
-                            st.metric("Active Subs", db_info.get('subscriptions', 0))
+                        # Single table element instead of one st.metric per stat
+                        st.markdown(
+                            "| Table | Count |\n"
+                            "|---|---:|\n"
+                            f"| Users | {db_info.get('users', 0):,} |\n"
+                            f"| Businesses | {db_info.get('businesses', 0):,} |\n"
+                            f"| Call Logs | {db_info.get('call_logs', 0):,} |\n"
+                            f"| Active Subs | {db_info.get('subscriptions', 0):,} |"
+                        )
             else:
                 st.error(message)
 
@@ -294,6 +332,10 @@ with st.sidebar:
         logout()
         st.rerun()
 
+
+with st.sidebar:
+    render_sidebar()
+
 # ====================
 # Run Navigation
 # ====================
@@ -0,0 +1,16 @@
+"""Tests for the cold call CSV parser."""
+import io
+
+from components.cold_call.csv_parser import parse_contacts
+
+
+def test_parse_contacts_keeps_leading_zeros_in_phone():
+    uploaded_file = io.BytesIO(
+        b"name,company,phone\n"
+        b"Alice,Acme,007123\n"
+        b"Bob,Globex,07911123456\n"
+    )
+
+    contacts = parse_contacts(uploaded_file)
+
+    assert [c['phone'] for c in contacts] == ['007123', '07911123456']